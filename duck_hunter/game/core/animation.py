@@ -1,60 +1,112 @@
 """
 animation.py
 
-This module contains the Animation class for managing sprite sheet animations.
+This module contains the classes for sprite animations. An AnimationClip holds
+the immutable frames and timing shared by every entity of a kind, while an
+AnimationState is the small per-entity playback cursor into a clip.
 """
 import pygame
+from bisect import bisect_right
+
+class AnimationClip:
+    __slots__ = ("frames", "frame_durations", "loop", "frame_count", "frame_ends", "total_duration")
 
-class Animation:
     def __init__(self, frames, frame_durations, loop=True):
         """
-        Initializes an animation sequence.
+        Initializes an immutable animation sequence.
 
         :param frames: A list of pygame.Surface objects representing animation frames.
         :param frame_durations: A list or tuple of durations (in seconds) for each frame.
                                 If a single value, it's used for all frames.
         :param loop: Boolean indicating if the animation should loop.
         """
-        self.frames = frames
+        self.frames = tuple(frames)
         if isinstance(frame_durations, (list, tuple)):
-            self.frame_durations = frame_durations
+            self.frame_durations = tuple(frame_durations)
         else:
-            self.frame_durations = [frame_durations] * len(self.frames)
-        
+            self.frame_durations = (frame_durations,) * len(self.frames)
+
         self.loop = loop
         self.frame_count = len(self.frames)
-        self.current_frame_index = 0
-        self.current_frame_duration = 0
-        self.is_done = False
+
+        # Prefix sums: frame i is shown while frame_ends[i-1] <= t < frame_ends[i]
+        self.frame_ends = []
+        total = 0
+        for duration in self.frame_durations:
+            total += duration
+            self.frame_ends.append(total)
+        self.frame_ends = tuple(self.frame_ends)
+        self.total_duration = total
+
+    def frame_index_at(self, elapsed):
+        """Returns the index of the frame shown after `elapsed` seconds of playback."""
+        if elapsed >= self.total_duration:
+            if not self.loop or self.total_duration <= 0:
+                return self.frame_count - 1
+            elapsed %= self.total_duration
+        return bisect_right(self.frame_ends, elapsed)
+
+    def is_done_at(self, elapsed):
+        """Returns True if a non-looping clip has finished after `elapsed` seconds."""
+        return not self.loop and elapsed >= self.total_duration
+
+class AnimationState:
+    __slots__ = ("clip", "elapsed")
+
+    def __init__(self, clip):
+        """
+        Initializes the playback state of one entity.
+
+        :param clip: The shared AnimationClip to play.
+        """
+        self.clip = clip
+        self.elapsed = 0
+
+    def play(self, clip):
+        """Switches to another clip and restarts playback."""
+        self.clip = clip
+        self.elapsed = 0
 
     def update(self, dt):
         """
-        Updates the animation state based on the delta time.
+        Advances playback by the delta time.
         """
-        if self.is_done:
-            return
+        self.elapsed += dt
+        clip = self.clip
+        # Keep looping cursors small so float precision never degrades
+        if clip.loop and self.elapsed >= clip.total_duration > 0:
+            self.elapsed %= clip.total_duration
+
+    @property
+    def current_frame_index(self):
+        return self.clip.frame_index_at(self.elapsed)
 
-        self.current_frame_duration += dt
-        if self.current_frame_duration >= self.frame_durations[self.current_frame_index]:
-            self.current_frame_duration -= self.frame_durations[self.current_frame_index]
-            self.current_frame_index += 1
-            if self.current_frame_index >= self.frame_count:
-                if self.loop:
-                    self.current_frame_index = 0
-                else:
-                    self.is_done = True
-                    self.current_frame_index = self.frame_count - 1
+    @property
+    def is_done(self):
+        return self.clip.is_done_at(self.elapsed)
+
+    @property
+    def frames(self):
+        return self.clip.frames
 
     def get_current_frame(self):
         """
         Returns the current frame of the animation.
         """
-        return self.frames[self.current_frame_index]
+        return self.clip.frames[self.clip.frame_index_at(self.elapsed)]
 
     def reset(self):
         """
         Resets the animation to its first frame.
         """
-        self.current_frame_index = 0
-        self.current_frame_duration = 0
-        self.is_done = False 
\ No newline at end of file
+        self.elapsed = 0
+
+def advance_all(states, dt):
+    """
+    Advances many playback states by the same delta time in one call.
+
+    :param states: An iterable of AnimationState objects.
+    :param dt: The delta time in seconds.
+    """
+    for state in states:
+        state.update(dt)
@@ -8,11 +8,13 @@ import pygame
 from game.core.resource_manager import resources
 from game.utils import constants as const
 import os
-import numpy as np
+import sys
 import numpy as np
 
-# Force a more compatible audio driver before initialization to avoid hardware issues.
-os.environ['SDL_AUDIODRIVER'] = 'directsound'
+# Prefer a more compatible audio driver on Windows to avoid hardware issues.
+# Elsewhere, and whenever a driver was chosen explicitly (e.g. "dummy" in headless mode), SDL decides.
+if sys.platform == "win32":
+    os.environ.setdefault('SDL_AUDIODRIVER', 'directsound')
 
 class AudioManager:
     """A class to manage all game audio."""
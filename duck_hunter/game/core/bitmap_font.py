@@ -0,0 +1,53 @@
+"""
+bitmap_font.py
+
+A bitmap glyph atlas for text that changes every frame, like scores and
+timers. Each glyph is rasterized once; strings are then composed by blitting
+areas of the atlas instead of rendering them with the font.
+"""
+import pygame
+
+DIGIT_CHARACTERS = "0123456789:/-."
+
+class GlyphAtlas:
+    def __init__(self, font, color, characters=DIGIT_CHARACTERS, antialias=True):
+        """
+        Rasterizes the given characters once into a single surface.
+
+        :param font: The pygame.font.Font to render the glyphs with.
+        :param color: The glyph color.
+        :param characters: The characters the atlas can draw.
+        :param antialias: Whether glyphs are rendered antialiased.
+        """
+        glyph_surfaces = [font.render(char, antialias, color) for char in characters]
+        self.height = max(font.get_height(), max(glyph.get_height() for glyph in glyph_surfaces))
+        width = sum(glyph.get_width() for glyph in glyph_surfaces)
+
+        self.surface = pygame.Surface((width, self.height), pygame.SRCALPHA)
+        self.glyphs = {}  # char -> area rect in the atlas surface
+        x = 0
+        for char, glyph in zip(characters, glyph_surfaces):
+            self.surface.blit(glyph, (x, 0))
+            self.glyphs[char] = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            x += glyph.get_width()
+
+    def can_render(self, text):
+        """Returns True if every character of text is in the atlas."""
+        return all(char in self.glyphs for char in text)
+
+    def measure(self, text):
+        """Returns the width in pixels of text drawn with this atlas."""
+        return sum(self.glyphs[char].width for char in text)
+
+    def layout(self, text, pos):
+        """
+        Returns a blit sequence drawing text with its top-left corner at pos,
+        ready to be passed to Surface.blits.
+        """
+        x, y = pos
+        sequence = []
+        for char in text:
+            area = self.glyphs[char]
+            sequence.append((self.surface, (x, y), area))
+            x += area.width
+        return sequence
@@ -0,0 +1,60 @@
+"""
+dirty_rects.py
+
+Tracks which regions of the screen changed during a frame so only those are
+pushed to the display with pygame.display.update(rects) instead of a full flip.
+"""
+import pygame
+
+class DirtyRectTracker:
+    def __init__(self, screen_size, full_redraw_threshold=0.5):
+        """
+        Initializes the tracker.
+
+        :param screen_size: The (width, height) of the display surface.
+        :param full_redraw_threshold: Fraction of the screen area above which the
+                                      frame is presented with a full flip instead.
+        """
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self.full_redraw_threshold = full_redraw_threshold
+        self.current_rects = []
+        self.previous_rects = []
+        self.full_redraw = True  # The first frame always needs a full flip
+
+    def mark(self, rect):
+        """Marks a region as changed this frame."""
+        rect = self.screen_rect.clip(rect)
+        if rect.width and rect.height:
+            self.current_rects.append(rect)
+
+    def mark_many(self, rects):
+        """Marks several regions as changed this frame."""
+        for rect in rects:
+            self.mark(rect)
+
+    def mark_all(self):
+        """Forces the next present to update the whole screen."""
+        self.full_redraw = True
+
+    def present(self):
+        """
+        Pushes this frame to the display. Regions drawn last frame are updated as
+        well, so whatever moved away from them gets erased on screen.
+        Returns True if a full flip was used.
+        """
+        # The same region is often marked two frames in a row (e.g. a scrolling band)
+        rects = list(dict.fromkeys(map(tuple, self.previous_rects + self.current_rects)))
+        screen_area = self.screen_rect.width * self.screen_rect.height
+        # Overlapping rects are counted twice, which only makes the fallback earlier
+        covered_area = sum(width * height for _, _, width, height in rects)
+
+        full_flip = self.full_redraw or covered_area > screen_area * self.full_redraw_threshold
+        if full_flip:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+        self.previous_rects = self.current_rects
+        self.current_rects = []
+        self.full_redraw = False
+        return full_flip
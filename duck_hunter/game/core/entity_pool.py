@@ -0,0 +1,62 @@
+"""
+entity_pool.py
+
+Recycles game entities instead of building a new sprite for every spawn.
+Killed entities go back to their pool and are brought back to life with
+their reset() method the next time one is needed.
+"""
+
+class EntityPool:
+    def __init__(self, factory, capacity):
+        """
+        Initializes an empty pool.
+
+        :param factory: Builds a new entity; called with the same arguments as reset().
+        :param capacity: Maximum number of idle entities kept for reuse. Entities
+                         released beyond it are left to the garbage collector.
+        """
+        self.factory = factory
+        self.capacity = capacity
+        self.free = []
+
+        # Counters, see get_stats
+        self.live = 0
+        self.high_water = 0
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self, *args, **kwargs):
+        """Returns an entity reset with the given arguments, reusing an idle one if possible."""
+        if self.free:
+            entity = self.free.pop()
+            entity.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            entity = self.factory(*args, **kwargs)
+            self.created += 1
+        entity.pool = self
+        self.live += 1
+        self.high_water = max(self.high_water, self.live)
+        return entity
+
+    def release(self, entity):
+        """Takes back a dead entity. Each entity is released once per acquire."""
+        entity.pool = None
+        self.live -= 1
+        if len(self.free) < self.capacity:
+            self.free.append(entity)
+        else:
+            self.discarded += 1
+
+    def get_stats(self):
+        """Returns the pool counters. In steady state 'created' stops growing."""
+        return {
+            "capacity": self.capacity,
+            "live": self.live,
+            "idle": len(self.free),
+            "high_water": self.high_water,
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+        }
@@ -0,0 +1,49 @@
+"""
+fixed_timestep.py
+
+Decouples the simulation rate from the frame rate. Frame times are collected
+in an accumulator and paid out as whole simulation steps of a fixed length, so
+gameplay advances the same way at 30 or 144 FPS. The time left over is exposed
+as an interpolation factor for rendering between the last two steps.
+"""
+
+class FixedTimestep:
+    def __init__(self, step_hz, max_steps):
+        """
+        Initializes an empty accumulator.
+
+        :param step_hz: Simulation steps per second.
+        :param max_steps: Maximum number of steps run for one frame. Time beyond
+                          that is dropped, so after a hitch the game slows down
+                          for a moment instead of spiralling into ever longer frames.
+        """
+        self.step_dt = 1.0 / step_hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_time = 0.0  # Total seconds dropped by the catch-up cap
+
+    def reset(self):
+        """Forgets any partial step, e.g. when a new game starts."""
+        self.accumulator = 0.0
+
+    def advance(self, frame_dt):
+        """
+        Adds a frame's duration and returns how many simulation steps to run for it.
+
+        :param frame_dt: The duration of the frame in seconds.
+        """
+        self.accumulator += frame_dt
+        steps = int(self.accumulator / self.step_dt)
+        if steps > self.max_steps:
+            # Keep the partial step, drop the rest of the backlog
+            dropped = (steps - self.max_steps) * self.step_dt
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+            steps = self.max_steps
+        self.accumulator -= steps * self.step_dt
+        return steps
+
+    @property
+    def alpha(self):
+        """How far the current frame is between the previous and the latest step, from 0 to 1."""
+        return min(1.0, self.accumulator / self.step_dt)
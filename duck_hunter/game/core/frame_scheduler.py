@@ -0,0 +1,80 @@
+"""
+frame_scheduler.py
+
+Paces the main loop. Runs at the full frame rate while something is
+happening and drops to a low idle rate on menus and the pause screen once
+no input has arrived for a short grace period.
+"""
+import pygame
+
+# Events that count as user activity and bring the loop back to full rate
+INPUT_EVENTS = (
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.WINDOWFOCUSGAINED,
+    pygame.WINDOWEXPOSED,
+)
+
+# Milliseconds between checks for queued input while waiting out an idle frame
+INPUT_POLL_INTERVAL = 10
+
+class FrameScheduler:
+    def __init__(self, active_fps, idle_fps, grace_period=1.0, wait_for_events=False):
+        """
+        Initializes the scheduler.
+
+        :param active_fps: The frame rate cap while active.
+        :param idle_fps: The frame rate cap once idle.
+        :param grace_period: Seconds without input before an idle screen drops to idle_fps.
+        :param wait_for_events: If True, idle frames end early as soon as input is
+                                queued, instead of sleeping for the whole frame.
+        """
+        self.clock = pygame.time.Clock()
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.grace_period = grace_period
+        self.wait_for_events = wait_for_events
+        self.last_activity = pygame.time.get_ticks()
+        self.last_tick = self.last_activity
+        self.throttled = False
+
+    def handle_event(self, event):
+        """Records user input so the next frames run at the full rate."""
+        if event.type in INPUT_EVENTS:
+            self.notify_activity()
+
+    def notify_activity(self):
+        """Keeps the loop at the full rate for at least the grace period."""
+        self.last_activity = pygame.time.get_ticks()
+
+    def tick(self, idle):
+        """
+        Waits for the next frame and returns the delta time in seconds.
+
+        :param idle: True if the current screen is static enough to be throttled
+                     (a menu or the pause screen). Gameplay always runs at full rate.
+        """
+        idle_time = (pygame.time.get_ticks() - self.last_activity) / 1000.0
+        self.throttled = idle and idle_time >= self.grace_period
+        if not self.throttled:
+            return self.finish_frame(self.clock.tick(self.active_fps))
+
+        if self.wait_for_events:
+            # Sleep until input is queued or the idle frame is due, whichever is first.
+            # Peeking leaves the queue as it is; other events wait for the idle frame.
+            frame_time = 1000 / self.idle_fps
+            while pygame.time.get_ticks() - self.last_tick < frame_time:
+                if pygame.event.peek(INPUT_EVENTS):
+                    self.notify_activity()
+                    return self.finish_frame(self.clock.tick())
+                pygame.time.wait(INPUT_POLL_INTERVAL)
+        return self.finish_frame(self.clock.tick(self.idle_fps))
+
+    def finish_frame(self, frame_ms):
+        """Records the start of the next frame and converts its duration to seconds."""
+        self.last_tick = pygame.time.get_ticks()
+        return frame_ms / 1000.0
@@ -0,0 +1,78 @@
+"""
+replay.py
+
+Records the player's inputs during a session so the session can be
+re-simulated exactly. Together with the seed of the RandomService and the fixed
+simulation step, the inputs are all a session depends on. Inputs are keyed by
+simulation tick (the number of fixed steps run before they happened) rather than
+by wall time, so a replay does not depend on the frame rate it runs at.
+"""
+import json
+
+REPLAY_VERSION = 1
+
+# Recorded input kinds
+SHOT = "shot"        # [tick, "shot", x, y]
+RELOAD = "reload"    # [tick, "reload"]
+PAUSE = "pause"      # [tick, "pause", 1 if paused else 0]
+
+class InputRecording:
+    def __init__(self, seed, mode, sim_hz, screen_size, background_seed=None, events=None, end_tick=None,
+                 checksum=None):
+        """
+        Initializes a recording.
+
+        :param seed: The RandomService seed the session started with.
+        :param mode: The game mode of the session.
+        :param sim_hz: Simulation steps per second the session ran at.
+        :param screen_size: The (width, height) the session ran at; spawn positions
+                            and sprite sizes depend on it.
+        :param background_seed: The seed the background layout was built from, which
+                                only affects rendering. Defaults to seed.
+        :param events: Recorded inputs, each a list starting with its tick and kind.
+        :param end_tick: The tick the session ended at, set by finish().
+        :param checksum: Game.state_checksum() at end_tick, set by finish().
+        """
+        self.seed = seed
+        self.mode = mode
+        self.sim_hz = sim_hz
+        self.screen_size = tuple(screen_size)
+        self.background_seed = seed if background_seed is None else background_seed
+        self.events = events if events is not None else []
+        self.end_tick = end_tick
+        self.checksum = checksum
+
+    def record(self, tick, kind, *values):
+        """Appends an input that happened after `tick` simulation steps."""
+        self.events.append([tick, kind, *values])
+
+    def finish(self, tick, checksum):
+        """Marks the end of the session and the state it ended in."""
+        self.end_tick = tick
+        self.checksum = checksum
+
+    def save(self, path):
+        """Writes the recording as compact JSON."""
+        data = {
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "mode": self.mode,
+            "sim_hz": self.sim_hz,
+            "screen_size": self.screen_size,
+            "background_seed": self.background_seed,
+            "end_tick": self.end_tick,
+            "checksum": self.checksum,
+            "events": self.events,
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        """Reads a recording written by save()."""
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        return cls(data["seed"], data["mode"], data["sim_hz"], data["screen_size"], data.get("background_seed"),
+                   data["events"], data["end_tick"], data["checksum"])
@@ -6,6 +6,12 @@ sprites, sounds, and fonts to ensure efficiency.
 """
 import pygame
 import os
+import json
+from collections import OrderedDict
+from game.utils import constants as const
+from game.utils.helpers import load_sprite_sheet
+from game.core.texture_atlas import TextureAtlas
+from game.core.bitmap_font import GlyphAtlas
 
 class ResourceManager:
     """A singleton class to manage game resources."""
@@ -24,6 +30,12 @@ class ResourceManager:
         self.image_cache = {}
         self.sound_cache = {}
         self.font_cache = {}
+        self.json_cache = {}
+        self.frame_cache = {}
+        self.animation_cache = {}
+        self.text_cache = OrderedDict()
+        self.glyph_atlas_cache = {}
+        self.atlas = TextureAtlas(const.ATLAS_PAGE_SIZE)
 
     def load_image(self, file_name, use_alpha=True):
         """
@@ -34,9 +46,8 @@ class ResourceManager:
             return self.image_cache[file_name]
 
         try:
-            image = pygame.image.load(file_name).convert()
-            if use_alpha:
-                image = image.convert_alpha()
+            image = pygame.image.load(file_name)
+            image = image.convert_alpha() if use_alpha else image.convert()
             self.image_cache[file_name] = image
             return image
         except pygame.error as e:
@@ -76,5 +87,137 @@ class ResourceManager:
             print(f"Error loading font: {file_name}")
             raise SystemExit(e)
 
+    def render_text(self, font, text, color, antialias=True):
+        """
+        Renders text with a font, reusing the surface from a bounded LRU cache
+        when the same (font, text, color, antialias) was rendered recently.
+        The returned surface is shared and must not be modified.
+        """
+        key = (font, text, color, antialias)
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.text_cache.move_to_end(key)
+            return surface
+
+        surface = font.render(text, antialias, color)
+        self.text_cache[key] = surface
+        if len(self.text_cache) > const.TEXT_CACHE_SIZE:
+            self.text_cache.popitem(last=False)
+        return surface
+
+    def get_glyph_atlas(self, font, color):
+        """
+        Returns the digit glyph atlas for a font and color, building it once.
+        Used for numeric text that changes too often for the text cache.
+        """
+        key = (font, color)
+        atlas = self.glyph_atlas_cache.get(key)
+        if atlas is None:
+            atlas = GlyphAtlas(font, color)
+            self.glyph_atlas_cache[key] = atlas
+        return atlas
+
+    def load_json(self, file_name):
+        """
+        Loads and parses a JSON file, caches it, and returns the parsed data.
+        Missing files raise FileNotFoundError so callers can fall back.
+        """
+        if file_name in self.json_cache:
+            return self.json_cache[file_name]
+
+        with open(file_name) as f:
+            data = json.load(f)
+        self.json_cache[file_name] = data
+        return data
+
+    def get_frames(self, key, builder):
+        """
+        Returns a shared, immutable tuple of animation frames for the given key.
+        The builder is only called the first time a key is requested; its frames
+        are packed into the shared atlas and every entity of the same kind
+        references the same subsurface views.
+
+        :param key: A hashable tuple identifying the frames, e.g.
+                    ("duck", duck_type, color_scheme, UI_SCALE, "fly").
+        :param builder: A callable returning a list of pygame.Surface frames.
+        """
+        frames = self.frame_cache.get(key)
+        if frames is None:
+            frames = self.pack_frames(builder())
+            self.frame_cache[key] = frames
+        return frames
+
+    def pack_frames(self, frames):
+        """Copies frames into the shared atlas and returns zero-copy views of them."""
+        packed = []
+        for frame in frames:
+            page_index, rect = self.atlas.add(frame)
+            packed.append(self.atlas.pages[page_index].subsurface(rect))
+        return tuple(packed)
+
+    def clear_frame_cache(self):
+        """
+        Drops all cached frames, e.g. after the UI scale changes. The new atlas
+        allocates its first page only when a frame is added.
+        """
+        self.frame_cache.clear()
+        self.animation_cache.clear()
+        self.atlas = TextureAtlas(const.ATLAS_PAGE_SIZE)
+
+    def load_animations(self, entity_name):
+        """
+        Returns the animations of an entity from animations.json as
+        {name: (frame_key, duration, loop)}. The sprite sheet is sliced once into
+        subsurface views and each animation's frames are stored in the frame
+        cache under ("animation", entity_name, name) for O(1) lookup.
+        Raises FileNotFoundError, KeyError or pygame.error if the entity has no
+        usable sprite sheet.
+        """
+        if entity_name in self.animation_cache:
+            return self.animation_cache[entity_name]
+
+        anim_data = self.load_json(os.path.join(const.CONFIG_PATH, "animations.json"))[entity_name]
+        sheet = self.load_image(os.path.join(const.SPRITES_PATH, anim_data["sprite_sheet"]))
+        frame_width, frame_height = anim_data["frame_size"]
+        num_frames = sum(len(d["frames"]) for d in anim_data["animations"].values())
+        all_frames = load_sprite_sheet(sheet, frame_width, frame_height, num_frames, copy=False)
+
+        animations = {}
+        for name, data in anim_data["animations"].items():
+            frame_key = ("animation", entity_name, name)
+            self.frame_cache[frame_key] = tuple(all_frames[i] for i in data["frames"])
+            animations[name] = (frame_key, data["duration"], data["loop"])
+        self.animation_cache[entity_name] = animations
+        return animations
+
+    def baked_sprites_dir(self, ui_scale):
+        """Returns the directory holding the sprites baked for a UI scale."""
+        return os.path.join(const.BAKED_SPRITES_PATH, f"scale_{ui_scale:.4f}")
+
+    def load_baked_sprites(self):
+        """
+        Fills the frame cache from the atlases baked by tools/bake_sprites.py for
+        the current UI_SCALE. Frames become views into the loaded atlas pages.
+        Returns False when no bake matches, in which case sprites are drawn
+        procedurally on first use as before.
+        """
+        bake_dir = self.baked_sprites_dir(const.UI_SCALE)
+        try:
+            manifest = self.load_json(os.path.join(bake_dir, "manifest.json"))
+        except FileNotFoundError:
+            print("No baked sprites for this display scale. Using procedural sprites.")
+            return False
+
+        if abs(manifest["ui_scale"] - const.UI_SCALE) > 1e-9:
+            print("Baked sprites were made for another display scale. Using procedural sprites.")
+            return False
+
+        pages = [self.load_image(os.path.join(bake_dir, page)) for page in manifest["pages"]]
+        for sprite in manifest["sprites"]:
+            frames = tuple(pages[page].subsurface((x, y, w, h)) for page, x, y, w, h in sprite["frames"])
+            self.frame_cache[tuple(sprite["key"])] = frames
+        print(f"Loaded {len(manifest['sprites'])} baked sprites from {bake_dir}")
+        return True
+
 # Create a single instance of the resource manager for global access
 resources = ResourceManager() 
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+rng.py
+
+The game's single source of randomness. Gameplay (spawns, entity properties)
+draws from `random`, vectorized visual effects from `numpy`, and systems whose
+randomness must not shift the gameplay sequence (e.g. the background layout)
+get their own named stream. Seeding the service makes a session reproducible.
+"""
+import random
+import numpy as np
+
+class RandomService:
+    def __init__(self, seed=None):
+        """
+        Initializes the generators.
+
+        :param seed: An integer seed, or None to pick one at random.
+        """
+        self.random = random.Random()
+        self.numpy = np.random.Generator(np.random.PCG64())
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """
+        Restarts every generator from a seed and returns the seed. The generator
+        objects are kept, so everything holding one follows the new seed.
+
+        :param seed: An integer seed, or None to pick one at random.
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        self.random.seed(seed)
+        self.numpy.bit_generator.state = np.random.PCG64(seed).state
+        return seed
+
+    def stream(self, name):
+        """
+        Returns a new random.Random for one system, derived from the seed and the
+        name, so its draws do not depend on or disturb any other stream.
+        """
+        return random.Random(f"{self.seed}:{name}")
+
+random_service = RandomService()
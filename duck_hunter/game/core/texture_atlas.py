@@ -0,0 +1,82 @@
+"""
+texture_atlas.py
+
+A simple shelf packer that copies many small frames into a few large
+atlas pages. Backs the shared frame cache in ResourceManager and is used
+to bake procedural sprites to disk.
+"""
+import pygame
+
+class TextureAtlas:
+    def __init__(self, page_size=2048, padding=1):
+        """
+        Initializes an empty atlas.
+
+        :param page_size: Width and height of each atlas page in pixels. Frames larger
+                          than this get a page of their own.
+        :param padding: Transparent pixels left between frames to avoid bleeding.
+        """
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []  # Allocated when the first frame that needs one is added
+        self.used_sizes = []  # (width, height) actually covered on each page
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def add(self, frame):
+        """
+        Copies a frame into the atlas.
+
+        :param frame: The pygame.Surface to pack.
+        :return: A tuple (page_index, rect) locating the frame in the atlas.
+        """
+        width, height = frame.get_size()
+        page_index, rect = self.allocate(width, height)
+        self.pages[page_index].blit(frame, rect)
+        return page_index, rect
+
+    def allocate(self, width, height):
+        """Reserves space for a frame, starting a new shelf or page when needed."""
+        if self.pages:
+            page_width, page_height = self.pages[-1].get_size()
+            if self.shelf_x + width > page_width:
+                # Start a new shelf below the current one
+                self.shelf_x = 0
+                self.shelf_y += self.shelf_height + self.padding
+                self.shelf_height = 0
+            if self.shelf_x + width <= page_width and self.shelf_y + height <= page_height:
+                return len(self.pages) - 1, self.place(width, height)
+
+        # Open a new page, at least large enough for this frame
+        self.new_page(width, height)
+        return len(self.pages) - 1, self.place(width, height)
+
+    def new_page(self, min_width=0, min_height=0):
+        """
+        Opens an empty page that the next frames are packed into. Once a display
+        mode is set, pages are created in the display's pixel format, so the
+        frames viewing into them blit without a per-blit conversion.
+        """
+        page_size = (max(self.page_size, min_width), max(self.page_size, min_height))
+        page = pygame.Surface(page_size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        self.pages.append(page)
+        self.used_sizes.append((0, 0))
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def place(self, width, height):
+        """Places a frame at the shelf cursor of the last page and advances it."""
+        rect = pygame.Rect(self.shelf_x, self.shelf_y, width, height)
+        self.shelf_x += width + self.padding
+        self.shelf_height = max(self.shelf_height, height)
+        used_width, used_height = self.used_sizes[-1]
+        self.used_sizes[-1] = (max(used_width, rect.right), max(used_height, rect.bottom))
+        return rect
+
+    def trimmed_pages(self):
+        """Returns copies of the pages cropped to the area actually used."""
+        return [page.subsurface((0, 0) + size).copy() for page, size in zip(self.pages, self.used_sizes)]
@@ -5,19 +5,79 @@ This module defines the Duck entity, including its behavior, animation,
 and interactions within the game.
 """
 import pygame
-import os
 from game.core.resource_manager import resources
-from game.utils.helpers import load_sprite_sheet
-from game.core.animation import Animation
+from game.core.animation import AnimationClip, AnimationState
+from game.core.rng import random_service
+from game.systems.entity_registry import FLYING_DUCKS, FALLING_DUCKS
+from game.entities.entity import Entity
 from game.utils import constants as const
 import math
-import random
-import json
+from typing import NamedTuple
 
-class Duck(pygame.sprite.Sprite):
-    def __init__(self, initial_pos, duck_type="common"):
+class DuckType(NamedTuple):
+    """The immutable properties shared by every duck of a type."""
+    points: int
+    speed_range: tuple
+    amplitude_range: tuple
+    frequency_range: tuple
+    spawn_weight: int
+    color_scheme: int
+
+DUCK_TYPES = {
+    "common": DuckType(
+        points=100,
+        speed_range=(150, 250),
+        amplitude_range=(20, 60),
+        frequency_range=(0.01, 0.02),
+        spawn_weight=60,  # 60% chance
+        color_scheme=0  # Brown duck
+    ),
+    "rare": DuckType(
+        points=500,
+        speed_range=(200, 350),
+        amplitude_range=(30, 80),
+        frequency_range=(0.015, 0.025),
+        spawn_weight=25,  # 25% chance
+        color_scheme=1  # Gray duck
+    ),
+    "golden": DuckType(
+        points=1000,
+        speed_range=(300, 450),
+        amplitude_range=(40, 100),
+        frequency_range=(0.02, 0.03),
+        spawn_weight=10,  # 10% chance
+        color_scheme=2  # Golden duck
+    ),
+    "boss": DuckType(
+        points=2000,
+        speed_range=(100, 200),
+        amplitude_range=(10, 30),
+        frequency_range=(0.005, 0.01),
+        spawn_weight=5,  # 5% chance
+        color_scheme=3  # Green duck
+    ),
+}
+
+class Duck(Entity):
+    # Animation clips per frame cache key, shared by all ducks of a type
+    animation_clips = {}
+    state_kinds = {"flying": FLYING_DUCKS, "falling": FALLING_DUCKS}
+
+    __slots__ = ("duck_type", "type_data", "clips", "current_animation_name", "fall_rotations",
+                 "amplitude", "frequency", "initial_y", "fall_speed", "flight", "flight_slot")
+
+    def __init__(self, initial_pos, duck_type="common", speed_bonus=0, rng=None):
         super().__init__()
-        
+        self.reset(initial_pos, duck_type, speed_bonus, rng)
+
+    def reset(self, initial_pos, duck_type="common", speed_bonus=0, rng=None):
+        """
+        Places the duck at its spawn point and rolls a new flight path.
+
+        :param rng: The RandomService to draw the flight properties from.
+                    Defaults to the shared one.
+        """
+        self.rng = (rng or random_service).random
         # Duck type properties
         self.duck_type = duck_type
         self.type_data = self.get_duck_type_data(duck_type)
@@ -29,90 +89,84 @@ class Duck(pygame.sprite.Sprite):
         self.set_animation("fly")
         
         self.rect = self.image.get_rect(center=initial_pos)
-        self.pos = pygame.math.Vector2(self.rect.center)
+        self.prev_center = self.rect.center
+        self.pos.update(self.rect.center)
         
         # State machine
         self.state = "flying" # "flying", "falling"
         
         # AI properties (based on duck type)
-        self.speed = random.uniform(self.type_data["speed_range"][0], self.type_data["speed_range"][1])
-        self.amplitude = random.uniform(self.type_data["amplitude_range"][0], self.type_data["amplitude_range"][1])
-        self.frequency = random.uniform(self.type_data["frequency_range"][0], self.type_data["frequency_range"][1])
+        self.speed = self.rng.uniform(*self.type_data.speed_range) + speed_bonus
+        self.amplitude = self.rng.uniform(*self.type_data.amplitude_range)
+        self.frequency = self.rng.uniform(*self.type_data.frequency_range)
         self.initial_y = initial_pos[1]
         
         # Physics properties
         self.fall_speed = 0
         
+        # Set when a DuckFlightSimulation moves this duck instead of fly()
+        self.flight = None
+        self.flight_slot = -1
+        
         # Store point value
-        self.point_value = self.type_data["points"]
+        self.point_value = self.type_data.points
 
     def get_duck_type_data(self, duck_type):
         """Returns the data for a specific duck type."""
-        duck_types = {
-            "common": {
-                "points": 100,
-                "speed_range": (150, 250),
-                "amplitude_range": (20, 60),
-                "frequency_range": (0.01, 0.02),
-                "spawn_weight": 60,  # 60% chance
-                "color_scheme": 0  # Brown duck
-            },
-            "rare": {
-                "points": 500,
-                "speed_range": (200, 350),
-                "amplitude_range": (30, 80),
-                "frequency_range": (0.015, 0.025),
-                "spawn_weight": 25,  # 25% chance
-                "color_scheme": 1  # Gray duck
-            },
-            "golden": {
-                "points": 1000,
-                "speed_range": (300, 450),
-                "amplitude_range": (40, 100),
-                "frequency_range": (0.02, 0.03),
-                "spawn_weight": 10,  # 10% chance
-                "color_scheme": 2  # Golden duck
-            },
-            "boss": {
-                "points": 2000,
-                "speed_range": (100, 200),
-                "amplitude_range": (10, 30),
-                "frequency_range": (0.005, 0.01),
-                "spawn_weight": 5,  # 5% chance
-                "color_scheme": 3  # Green duck
-            }
-        }
-        return duck_types.get(duck_type, duck_types["common"])
+        return DUCK_TYPES.get(duck_type, DUCK_TYPES["common"])
 
     def load_assets(self):
-        """Loads duck assets and animations based on animations.json."""
+        """
+        Loads duck animations based on animations.json.
+        Frames are built once per (duck_type, color_scheme, UI_SCALE) and shared by
+        every duck of that type; each duck only owns an AnimationState cursor.
+        """
+        cache_key = ("duck", self.duck_type, self.type_data.color_scheme, const.UI_SCALE)
+        self.clips = Duck.animation_clips.get(cache_key)
+        if self.clips is None:
+            self.clips = self.build_animation_clips(cache_key)
+            Duck.animation_clips[cache_key] = self.clips
+        if self.animation is None:
+            self.animation = AnimationState(self.clips["fly"])
+        
+        # Falling frames are pre-rotated at quantized angles, one tuple per fall frame
+        self.fall_rotations = [
+            resources.get_frames(cache_key + ("fall_rotated", const.FALL_ROTATION_STEP, i),
+                                 lambda: self.create_fall_rotations(frame))
+            for i, frame in enumerate(self.clips["fall"].frames)
+        ]
+
+    def create_fall_rotations(self, frame):
+        """
+        Rotates a falling frame from 0 to 90 degrees in steps of FALL_ROTATION_STEP.
+        Index i of the result holds the frame rotated by min(90, i * step) degrees.
+        """
+        step = const.FALL_ROTATION_STEP
+        num_buckets = math.ceil(90 / step) + 1
+        return [pygame.transform.rotate(frame, min(90, i * step)) for i in range(num_buckets)]
+
+    def build_animation_clips(self, cache_key):
+        """
+        Builds the shared AnimationClips of a duck type as {name: clip}.
+        Only runs once per cache key.
+        """
         try:
-            with open(os.path.join(const.CONFIG_PATH, "animations.json")) as f:
-                anim_data = json.load(f)["duck"]
-            
-            sprite_sheet_path = os.path.join(const.SPRITES_PATH, anim_data["sprite_sheet"])
-            sprite_sheet = resources.load_image(sprite_sheet_path)
-            frame_size = anim_data["frame_size"]
-            
-            self.animations = {}
-            for name, data in anim_data["animations"].items():
-                all_frames = load_sprite_sheet(sprite_sheet, frame_size[0], frame_size[1], sum(len(d["frames"]) for d in anim_data["animations"].values()))
-                anim_frames = [all_frames[i] for i in data["frames"]]
-                self.animations[name] = Animation(anim_frames, data["duration"], data["loop"])
+            animations = resources.load_animations("duck")
             print("Loaded duck assets from animations.json")
+            return {name: AnimationClip(resources.frame_cache[frame_key], duration, loop)
+                    for name, (frame_key, duration, loop) in animations.items()}
             
-        except (pygame.error, FileNotFoundError, KeyError):
+        except (pygame.error, FileNotFoundError, KeyError, IndexError):
             print("Could not load assets from config. Using procedural placeholder.")
-            self.animations = {
-                "fly": Animation(self.create_procedural_duck_fly(), 0.2, True),
-                "fall": Animation(self.create_procedural_duck_fall(), 1.0, False)
+            return {
+                "fly": AnimationClip(resources.get_frames(cache_key + ("fly",), self.create_procedural_duck_fly), 0.2, True),
+                "fall": AnimationClip(resources.get_frames(cache_key + ("fall",), self.create_procedural_duck_fall), 1.0, False)
             }
 
     def set_animation(self, name):
         """Sets the current animation and updates the image."""
         self.current_animation_name = name
-        self.animation = self.animations[name]
-        self.animation.reset()
+        self.animation.play(self.clips[name])
         self.image = self.animation.get_current_frame()
 
     def create_procedural_duck_fly(self):
@@ -129,7 +183,7 @@ class Duck(pygame.sprite.Sprite):
             {"body": (0, 100, 0), "head": (0, 128, 0), "wing": (144, 238, 144), "beak": (255, 20, 147), "eye": (0, 0, 0)}   # Green duck
         ]
         
-        colors = duck_types[self.type_data["color_scheme"]]
+        colors = duck_types[self.type_data.color_scheme]
         
         # Frame 1: Wings up
         frame1 = pygame.Surface((sprite_width, sprite_height), pygame.SRCALPHA)
@@ -207,7 +261,7 @@ class Duck(pygame.sprite.Sprite):
             {"body": (0, 100, 0), "head": (0, 128, 0), "wing": (144, 238, 144), "beak": (255, 20, 147), "eye": (0, 0, 0)}   # Green duck
         ]
         
-        colors = duck_types[self.type_data["color_scheme"]]
+        colors = duck_types[self.type_data.color_scheme]
         
         # Scale all drawing coordinates
         scale_factor = const.UI_SCALE
@@ -244,14 +298,17 @@ class Duck(pygame.sprite.Sprite):
 
     def update(self, dt):
         """Updates the duck's animation and position based on its state."""
+        # A registered duck's animation is advanced with all others by the registry
+        if self.registry is None:
+            self.animation.update(dt)
+        
         if self.state == "flying":
-            self.fly(dt)
+            self.image = self.animation.get_current_frame()
+            if self.flight is None:
+                self.fly(dt)
         elif self.state == "falling":
             self.fall(dt)
 
-        self.animation.update(dt)
-        self.image = self.animation.get_current_frame()
-
     def fly(self, dt):
         """Handles the 'flying' state logic."""
         # Horizontal movement
@@ -272,11 +329,13 @@ class Duck(pygame.sprite.Sprite):
         self.fall_speed += gravity * dt
         self.pos.y += self.fall_speed * dt
         
-        # Simple rotation effect
+        # Simple rotation effect, looked up from the pre-rotated frames
         angle = min(90, self.fall_speed * 0.1)
-        self.image = pygame.transform.rotate(self.animation.get_current_frame(), angle)
+        rotations = self.fall_rotations[self.animation.current_frame_index]
+        self.image = rotations[int(angle / const.FALL_ROTATION_STEP + 0.5)]
         
-        self.rect = self.image.get_rect(center=self.pos)
+        self.rect.size = self.image.get_size()
+        self.rect.center = self.pos
         
         # Despawn when it falls off-screen
         if self.rect.top > const.SCREEN_HEIGHT:
@@ -285,9 +344,17 @@ class Duck(pygame.sprite.Sprite):
     def shoot_down(self):
         """Initiates the 'falling' state."""
         if self.state == "flying":
-            self.state = "falling"
+            if self.flight is not None:
+                self.flight.remove(self)
+            self.set_state("falling")
             self.set_animation("fall")
             
+    def kill(self):
+        """Takes the duck out of the flight simulation, then kills it like any entity."""
+        if self.flight is not None:
+            self.flight.remove(self)
+        super().kill()
+            
     def draw(self, surface):
         """
         Draws the duck onto the given surface.
@@ -0,0 +1,46 @@
+"""
+entity.py
+
+The base class of the shootable entities (ducks and ground animals). It ties
+an entity to the engine systems tracking it: the EntityRegistry group of its
+current state and the EntityPool it is recycled through.
+"""
+import pygame
+
+class Entity(pygame.sprite.Sprite):
+    """
+    Subclasses define reset() taking their constructor's arguments, which
+    EntityPool calls to recycle an entity instead of constructing a new one.
+    """
+
+    # EntityRegistry group for each state, e.g. {"flying": FLYING_DUCKS}
+    state_kinds = {}
+
+    # Entity state lives in slots, subclasses declaring only their own attributes.
+    # Sprite itself has no __slots__, so its group bookkeeping stays in a small
+    # __dict__; the image and rect slots shadow Sprite's Python-level properties.
+    # prev_center is the rect center before the last simulation step, for render interpolation.
+    __slots__ = ("image", "rect", "prev_center", "pos", "animation", "state", "registry", "pool",
+                 "speed", "point_value", "rng")
+
+    def __init__(self):
+        super().__init__()
+        self.animation = None
+        self.pos = pygame.math.Vector2()
+        self.registry = None  # Set by EntityRegistry.add
+        self.pool = None  # The EntityPool the entity returns to when killed
+
+    def set_state(self, state):
+        """Changes the state, keeping the registry's per-kind groups in sync."""
+        if self.registry is not None:
+            self.registry.set_state(self, state)
+        else:
+            self.state = state
+
+    def kill(self):
+        """Removes the entity from all groups and hands it back to its pool."""
+        super().kill()
+        if self.registry is not None:
+            self.registry.remove(self)
+        if self.pool is not None:
+            self.pool.release(self)
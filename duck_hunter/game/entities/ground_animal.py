@@ -5,14 +5,95 @@ This module defines ground animals (moose, deer, dinosaur) that move horizontall
 across the bottom of the screen, providing different targets and scoring opportunities.
 """
 import pygame
-import random
 import math
 from game.utils import constants as const
+from game.core.resource_manager import resources
+from game.core.animation import AnimationClip, AnimationState
+from game.core.rng import random_service
+from game.systems.entity_registry import WALKING_ANIMALS, DYING_ANIMALS
+from game.entities.entity import Entity
+from typing import NamedTuple
 
-class GroundAnimal(pygame.sprite.Sprite):
-    def __init__(self, animal_type="deer", initial_pos=None):
+class AnimalType(NamedTuple):
+    """The immutable properties shared by every ground animal of a type."""
+    points: int
+    speed_range: tuple
+    base_size: tuple  # Before display scaling
+    color: tuple
+    spawn_weight: int
+
+    @property
+    def size(self):
+        """The sprite size scaled for the current display."""
+        # Scale base sizes based on display scaling
+        scale_factor = const.UI_SCALE
+        return (int(self.base_size[0] * scale_factor), int(self.base_size[1] * scale_factor))
+
+ANIMAL_TYPES = {
+    "deer": AnimalType(
+        points=200,
+        speed_range=(80, 150),
+        base_size=(60, 40),
+        color=(139, 69, 19),  # Brown
+        spawn_weight=30
+    ),
+    "moose": AnimalType(
+        points=500,
+        speed_range=(60, 120),
+        base_size=(80, 60),
+        color=(101, 67, 33),  # Dark brown
+        spawn_weight=20
+    ),
+    "dinosaur": AnimalType(
+        points=1000,
+        speed_range=(100, 200),
+        base_size=(100, 80),
+        color=(34, 139, 34),  # Forest green
+        spawn_weight=15
+    ),
+    "rabbit": AnimalType(
+        points=150,
+        speed_range=(120, 180),
+        base_size=(40, 30),
+        color=(160, 82, 45),  # Light brown
+        spawn_weight=40
+    ),
+    "bear": AnimalType(
+        points=800,
+        speed_range=(70, 130),
+        base_size=(90, 70),
+        color=(101, 67, 33),  # Dark brown
+        spawn_weight=10
+    ),
+    "wolf": AnimalType(
+        points=600,
+        speed_range=(90, 160),
+        base_size=(70, 50),
+        color=(105, 105, 105),  # Gray
+        spawn_weight=25
+    ),
+}
+
+class GroundAnimal(Entity):
+    # Walking clips per frame cache key, shared by all animals of a type
+    walk_clips = {}
+    state_kinds = {"walking": WALKING_ANIMALS, "hit": DYING_ANIMALS, "dying": DYING_ANIMALS}
+
+    __slots__ = ("animal_type", "type_data", "walking_frames", "hit_frames", "fade_frames",
+                 "current_frame", "direction", "hit_timer")
+
+    def __init__(self, animal_type="deer", initial_pos=None, speed_bonus=0, rng=None):
         super().__init__()
-        
+        self.reset(animal_type, initial_pos, speed_bonus, rng)
+
+    def reset(self, animal_type="deer", initial_pos=None, speed_bonus=0, rng=None):
+        """
+        Builds the animal's frames for its type and starts it walking from the
+        left edge, or from initial_pos.
+
+        :param rng: The RandomService to draw the speed from. Defaults to the shared one.
+        """
+        self.rng = (rng or random_service).random
         self.animal_type = animal_type
         self.type_data = self.get_animal_type_data(animal_type)
         
@@ -25,10 +106,11 @@ class GroundAnimal(pygame.sprite.Sprite):
             initial_pos = (-50, const.SCREEN_HEIGHT - 100)
         
         self.rect = self.image.get_rect(center=initial_pos)
-        self.pos = pygame.math.Vector2(self.rect.center)
+        self.prev_center = self.rect.center
+        self.pos.update(self.rect.center)
         
         # Movement properties
-        self.speed = random.uniform(self.type_data["speed_range"][0], self.type_data["speed_range"][1])
+        self.speed = self.rng.uniform(*self.type_data.speed_range) + speed_bonus
         self.direction = 1  # 1 for right, -1 for left
         
         # State
@@ -36,94 +118,83 @@ class GroundAnimal(pygame.sprite.Sprite):
         self.hit_timer = 0
         
         # Store point value
-        self.point_value = self.type_data["points"]
+        self.point_value = self.type_data.points
 
     def get_animal_type_data(self, animal_type):
         """Returns the data for a specific animal type."""
-        # Scale base sizes based on display scaling
-        scale_factor = const.UI_SCALE
-        
-        animal_types = {
-            "deer": {
-                "points": 200,
-                "speed_range": (80, 150),
-                "size": (int(60 * scale_factor), int(40 * scale_factor)),
-                "color": (139, 69, 19),  # Brown
-                "spawn_weight": 30
-            },
-            "moose": {
-                "points": 500,
-                "speed_range": (60, 120),
-                "size": (int(80 * scale_factor), int(60 * scale_factor)),
-                "color": (101, 67, 33),  # Dark brown
-                "spawn_weight": 20
-            },
-            "dinosaur": {
-                "points": 1000,
-                "speed_range": (100, 200),
-                "size": (int(100 * scale_factor), int(80 * scale_factor)),
-                "color": (34, 139, 34),  # Forest green
-                "spawn_weight": 15
-            },
-            "rabbit": {
-                "points": 150,
-                "speed_range": (120, 180),
-                "size": (int(40 * scale_factor), int(30 * scale_factor)),
-                "color": (160, 82, 45),  # Light brown
-                "spawn_weight": 40
-            },
-            "bear": {
-                "points": 800,
-                "speed_range": (70, 130),
-                "size": (int(90 * scale_factor), int(70 * scale_factor)),
-                "color": (101, 67, 33),  # Dark brown
-                "spawn_weight": 10
-            },
-            "wolf": {
-                "points": 600,
-                "speed_range": (90, 160),
-                "size": (int(70 * scale_factor), int(50 * scale_factor)),
-                "color": (105, 105, 105),  # Gray
-                "spawn_weight": 25
-            }
-        }
-        return animal_types.get(animal_type, animal_types["deer"])
+        return ANIMAL_TYPES.get(animal_type, ANIMAL_TYPES["deer"])
 
     def create_sprite(self):
-        """Creates the animal sprite with walking animation frames."""
-        size = self.type_data["size"]
-        color = self.type_data["color"]
+        """
+        Sets up the walking animation. Frames are built once per
+        (animal_type, UI_SCALE) and shared by every animal of that type.
+        """
+        cache_key = ("ground_animal", self.animal_type, const.UI_SCALE)
+        self.walking_frames = resources.get_frames(cache_key + ("walk",), self.create_walking_frames)
         
-        # Create animation frames
-        self.walking_frames = []
+        walk_clip = GroundAnimal.walk_clips.get(cache_key)
+        if walk_clip is None:
+            walk_clip = AnimationClip(self.walking_frames, 0.3, True)  # 0.3 seconds per frame
+            GroundAnimal.walk_clips[cache_key] = walk_clip
+        if self.animation is None:
+            self.animation = AnimationState(walk_clip)
+        else:
+            self.animation.play(walk_clip)
         self.current_frame = 0
-        self.animation_timer = 0
-        self.animation_speed = 0.3  # seconds per frame
+        
+        # Red-tinted variants shown while hit, and a ladder of pre-faded copies
+        # per walking frame used while dying, so no frame is ever modified in place
+        self.hit_frames = resources.get_frames(
+            cache_key + ("hit",), lambda: [self.create_hit_frame(frame) for frame in self.walking_frames])
+        self.fade_frames = [
+            resources.get_frames(cache_key + ("fade", const.DEATH_FADE_STEPS, i),
+                                 lambda: self.create_fade_frames(frame))
+            for i, frame in enumerate(self.hit_frames)
+        ]
+        self.image = self.walking_frames[0]
+
+    def create_walking_frames(self):
+        """Draws the walking animation frames for this animal type."""
+        color = self.type_data.color
         
         if self.animal_type == "deer":
-            self.walking_frames = self.create_deer_animation(color)
+            return self.create_deer_animation(color)
         elif self.animal_type == "moose":
-            self.walking_frames = self.create_moose_animation(color)
+            return self.create_moose_animation(color)
         elif self.animal_type == "dinosaur":
-            self.walking_frames = self.create_dinosaur_animation(color)
+            return self.create_dinosaur_animation(color)
         elif self.animal_type == "rabbit":
-            self.walking_frames = self.create_rabbit_animation(color)
+            return self.create_rabbit_animation(color)
         elif self.animal_type == "bear":
-            self.walking_frames = self.create_bear_animation(color)
+            return self.create_bear_animation(color)
         elif self.animal_type == "wolf":
-            self.walking_frames = self.create_wolf_animation(color)
-        
-        self.image = self.walking_frames[0]
+            return self.create_wolf_animation(color)
+        return []
+
+    def create_hit_frame(self, frame):
+        """Returns a red-tinted copy of a walking frame."""
+        hit_frame = frame.copy()
+        hit_frame.fill((255, 0, 0, 100), special_flags=pygame.BLEND_MULT)
+        return hit_frame
+
+    def create_fade_frames(self, frame):
+        """
+        Returns DEATH_FADE_STEPS copies of a frame with decreasing opacity.
+        Index 0 is fully opaque; the alpha is baked into the pixels.
+        """
+        steps = const.DEATH_FADE_STEPS
+        fade_frames = []
+        for i in range(steps):
+            alpha = 255 * (steps - i) // steps
+            faded = frame.copy()
+            faded.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            fade_frames.append(faded)
+        return fade_frames
 
     def create_deer_animation(self, color):
         """Creates deer walking animation frames."""
         frames = []
-        size = self.type_data["size"]
-        
-    def create_deer_animation(self, color):
-        """Creates deer walking animation frames."""
-        frames = []
-        size = self.type_data["size"]
+        size = self.type_data.size
         scale_factor = const.UI_SCALE
         
         for frame in range(4):  # 4 walking frames
@@ -182,7 +253,7 @@ class GroundAnimal(pygame.sprite.Sprite):
     def create_moose_animation(self, color):
         """Creates moose walking animation frames."""
         frames = []
-        size = self.type_data["size"]
+        size = self.type_data.size
         scale_factor = const.UI_SCALE
         
         for frame in range(4):  # 4 walking frames
@@ -246,7 +317,7 @@ class GroundAnimal(pygame.sprite.Sprite):
     def create_dinosaur_animation(self, color):
         """Creates dinosaur walking animation frames."""
         frames = []
-        size = self.type_data["size"]
+        size = self.type_data.size
         scale_factor = const.UI_SCALE
         
         for frame in range(4):  # 4 walking frames
@@ -320,7 +391,7 @@ class GroundAnimal(pygame.sprite.Sprite):
     def create_rabbit_animation(self, color):
         """Creates rabbit hopping animation frames."""
         frames = []
-        size = self.type_data["size"]
+        size = self.type_data.size
         scale_factor = const.UI_SCALE
         
         for frame in range(3):  # 3 hopping frames
@@ -357,7 +428,7 @@ class GroundAnimal(pygame.sprite.Sprite):
     def create_bear_animation(self, color):
         """Creates bear walking animation frames."""
         frames = []
-        size = self.type_data["size"]
+        size = self.type_data.size
         scale_factor = const.UI_SCALE
         
         for frame in range(4):  # 4 walking frames
@@ -407,7 +478,7 @@ class GroundAnimal(pygame.sprite.Sprite):
     def create_wolf_animation(self, color):
         """Creates wolf walking animation frames."""
         frames = []
-        size = self.type_data["size"]
+        size = self.type_data.size
         scale_factor = const.UI_SCALE
         
         for frame in range(4):  # 4 walking frames
@@ -464,12 +535,11 @@ class GroundAnimal(pygame.sprite.Sprite):
             self.pos.x += self.speed * dt * self.direction
             self.rect.center = self.pos
             
-            # Update walking animation
-            self.animation_timer += dt
-            if self.animation_timer >= self.animation_speed:
-                self.animation_timer = 0
-                self.current_frame = (self.current_frame + 1) % len(self.walking_frames)
-                self.image = self.walking_frames[self.current_frame]
+            # Update walking animation, unless the registry advances it with all others
+            if self.registry is None:
+                self.animation.update(dt)
+            self.current_frame = self.animation.current_frame_index
+            self.image = self.walking_frames[self.current_frame]
             
             # Despawn if off screen
             if self.rect.right < 0 or self.rect.left > const.SCREEN_WIDTH:
@@ -478,7 +548,7 @@ class GroundAnimal(pygame.sprite.Sprite):
         elif self.state == "hit":
             self.hit_timer += dt
             if self.hit_timer > 0.5:  # Show hit for 0.5 seconds
-                self.state = "dying"
+                self.set_state("dying")
                 self.hit_timer = 0
                 
         elif self.state == "dying":
@@ -486,9 +556,10 @@ class GroundAnimal(pygame.sprite.Sprite):
             self.pos.y += 200 * dt  # Fall down
             self.rect.center = self.pos
             
-            # Fade out
+            # Fade out by picking the matching pre-faded frame
             alpha = max(0, 255 - int(self.hit_timer * 500))
-            self.image.set_alpha(alpha)
+            fade_step = (255 - alpha) * const.DEATH_FADE_STEPS // 256
+            self.image = self.fade_frames[self.current_frame][fade_step]
             self.hit_timer += dt
             
             if alpha <= 0:
@@ -497,10 +568,10 @@ class GroundAnimal(pygame.sprite.Sprite):
     def shoot_hit(self):
         """Called when the animal is shot."""
         if self.state == "walking":
-            self.state = "hit"
+            self.set_state("hit")
             self.hit_timer = 0
             # Change color to show hit
-            self.image.fill((255, 0, 0, 100), special_flags=pygame.BLEND_MULT)
+            self.image = self.hit_frames[self.current_frame]
 
     def draw(self, surface):
         """Draws the animal onto the given surface."""
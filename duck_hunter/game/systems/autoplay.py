@@ -0,0 +1,48 @@
+"""
+autoplay.py
+
+A simple bot that plays the game without a mouse, used by headless sessions
+for soak tests, benchmarking and balancing. It fires at the shootable target
+that is closest to the right edge of the screen (the one about to escape) at a
+fixed rate; reloading happens on its own when the weapon runs dry.
+"""
+import pygame
+from game.utils import constants as const
+
+class AutoplayBot:
+    def __init__(self, game, shot_interval=0.4, miss_offset=0):
+        """
+        Initializes the bot.
+
+        :param game: The Game to play.
+        :param shot_interval: Seconds between two shots.
+        :param miss_offset: Pixels added to the aim, to model a less accurate player.
+        """
+        self.game = game
+        self.shot_interval = shot_interval
+        self.miss_offset = miss_offset
+        self.shot_timer = 0
+        self.screen_rect = pygame.Rect(0, 0, const.SCREEN_WIDTH, const.SCREEN_HEIGHT)
+
+    def choose_target(self):
+        """Returns the visible target closest to escaping, or None."""
+        best = None
+        for group in self.game.entities.targets:
+            for target in group:
+                if not self.screen_rect.collidepoint(target.rect.center):
+                    continue
+                if best is None or target.rect.centerx > best.rect.centerx:
+                    best = target
+        return best
+
+    def update(self, dt):
+        """Shoots at a target whenever the shot interval has passed."""
+        self.shot_timer -= dt
+        if self.shot_timer > 0:
+            return
+        target = self.choose_target()
+        if target is None:
+            return
+        self.shot_timer = self.shot_interval
+        x, y = target.rect.center
+        self.game.shoot((x + self.miss_offset, y))
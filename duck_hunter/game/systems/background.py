@@ -6,89 +6,207 @@ scrolling background with a sense of depth.
 """
 import pygame
 from game.utils import constants as const
-import random
+from game.core.resource_manager import resources
+from game.core.rng import random_service
+
+# Cloud sizes are quantized so every cloud shape can be cached and baked
+CLOUD_WIDTH_RANGE = (100, 300)
+CLOUD_HEIGHT_RANGE = (50, 100)
+CLOUD_SIZE_STEP = 25
+
+def cloud_sizes():
+    """Returns every (width, height) a cloud can have."""
+    return [(width, height)
+            for width in range(CLOUD_WIDTH_RANGE[0], CLOUD_WIDTH_RANGE[1] + 1, CLOUD_SIZE_STEP)
+            for height in range(CLOUD_HEIGHT_RANGE[0], CLOUD_HEIGHT_RANGE[1] + 1, CLOUD_SIZE_STEP)]
+
+def draw_cloud(size):
+    """Creates a simple cloud shape on a surface."""
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.ellipse(surf, (255, 255, 255), (0, 0, size[0], size[1]))
+    return surf
+
+def get_cloud_surface(size):
+    """Returns the shared cloud surface for a size, drawing it on first use."""
+    width, height = size
+    return resources.get_frames(("cloud", width, height), lambda: [draw_cloud(size)])[0]
+
+SKY_COLOR = (135, 206, 235) # Sky blue
+
+# Tree silhouettes: tallest trunk per layer kind, plus the foliage radius above it
+TREE_HEIGHT_RANGE = (50, 100)
+FOREGROUND_TREE_HEIGHT_RANGE = (80, 150)
+FOLIAGE_RADIUS = 30
+
+_shared_background = None
+
+def get_shared_background():
+    """
+    Returns the background shared by the menus and gameplay, creating it on
+    first use. Create it after the display mode is set so its strips can be
+    converted to the display format.
+    """
+    global _shared_background
+    if _shared_background is None:
+        _shared_background = ParallaxBackground()
+        print(f"Background uses {_shared_background.memory_footprint() / (1024 * 1024):.1f} MB of surfaces")
+    return _shared_background
 
 class ParallaxBackground:
-    def __init__(self):
+    def __init__(self, rng=None):
+        """
+        Builds the background layers.
+
+        :param rng: The RandomService the layout is drawn from. Defaults to the shared one.
+                    The background has its own stream, so it never shifts gameplay randomness.
+        """
+        rng = rng or random_service
+        self.seed = rng.seed  # The layout is reproduced by building it under the same seed
+        self.rng = rng.stream("background")
+        
         # In a real scenario, you would load multiple image layers.
         # e.g., self.sky = resources.load_image("sky.png").convert()
         
-        # Creating dummy surfaces for testing purposes.
-        # Layer 0: Sky (with clouds)
-        self.sky_layer = pygame.Surface((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
-        self.sky_layer.fill((135, 206, 235)) # Sky blue
-        self.clouds = self.create_clouds(20, const.SCREEN_WIDTH * 2) # 20 clouds over double screen width
+        # Layer 0: Sky (with clouds). The sky itself is a plain fill, so only
+        # the band of clouds is kept as a surface.
+        self.cloud_speed = 0.1 # Slow scroll for clouds
+        self.cloud_period = const.SCREEN_WIDTH * 2
+        self.clouds = self.create_clouds(20, self.cloud_period) # 20 clouds over double screen width
+        self.cloud_strip, self.cloud_strip_y = self.create_cloud_strip(self.clouds, self.cloud_period)
         
-        # Layer 1: Distant hills/trees
-        self.distant_hills_layer = self.create_dummy_layer(const.SCREEN_WIDTH * 2, const.SCREEN_HEIGHT, (34, 139, 34), 100, 20)
-        
-        # Layer 2: Near ground/trees
-        self.near_ground_layer = self.create_dummy_layer(const.SCREEN_WIDTH * 2, const.SCREEN_HEIGHT, (0, 100, 0), 200, 40, True)
-
+        # Layers 1 and 2 are a solid ground band plus a transparent strip holding
+        # only the rows with tree silhouettes, instead of full-height canvases.
         self.layers = [
-            # (layer_surface, scroll_speed)
-            (self.sky_layer, 0.1), # Slow scroll for clouds
-            (self.distant_hills_layer, 0.25),
-            (self.near_ground_layer, 0.5)
+            # (trees_strip, strip_y, ground_color, ground_height, scroll_speed)
+            # Layer 1: Distant hills/trees
+            self.create_tree_layer(const.SCREEN_WIDTH * 2, const.SCREEN_HEIGHT, (34, 139, 34), 100, 20, 0.25),
+            # Layer 2: Near ground/trees
+            self.create_tree_layer(const.SCREEN_WIDTH * 2, const.SCREEN_HEIGHT, (0, 100, 0), 200, 40, 0.5, True)
         ]
         
         self.scroll = 0
+        
+        
+        # The screen band each scrolling strip shows in (clouds first, then the tree
+        # layers, each cut off where a nearer layer's ground covers it). The plain sky
+        # and ground fills around them never change.
+        self.scrolling_rects = [pygame.Rect(0, self.cloud_strip_y, const.SCREEN_WIDTH, self.cloud_strip.get_height())]
+        for i, (strip, strip_y, _, _, _) in enumerate(self.layers):
+            bottom = min([strip_y + strip.get_height()] +
+                         [const.SCREEN_HEIGHT - layer[3] for layer in self.layers[i + 1:]])
+            self.scrolling_rects.append(pygame.Rect(0, strip_y, const.SCREEN_WIDTH, max(0, bottom - strip_y)))
 
     def create_clouds(self, num_clouds, coverage_width):
         """Creates a list of cloud rects for rendering."""
         clouds = []
         for _ in range(num_clouds):
-            x = random.randint(0, coverage_width)
-            y = random.randint(50, 200)
-            width = random.randint(100, 300)
-            height = random.randint(50, 100)
+            x = self.rng.randint(0, coverage_width)
+            y = self.rng.randint(50, 200)
+            width = self.rng.randrange(CLOUD_WIDTH_RANGE[0], CLOUD_WIDTH_RANGE[1] + 1, CLOUD_SIZE_STEP)
+            height = self.rng.randrange(CLOUD_HEIGHT_RANGE[0], CLOUD_HEIGHT_RANGE[1] + 1, CLOUD_SIZE_STEP)
             clouds.append(pygame.Rect(x, y, width, height))
         return clouds
 
-    def create_dummy_layer(self, width, height, color, ground_height, num_trees, is_foreground=False):
-        """Creates a simple surface with a colored rectangle and tree silhouettes."""
-        layer = pygame.Surface((width, height), pygame.SRCALPHA)
-        pygame.draw.rect(layer, color, (0, height - ground_height, width, ground_height))
+    def create_cloud_strip(self, clouds, period):
+        """
+        Pre-renders all clouds into one transparent strip that wraps around every
+        `period` pixels. Returns the strip and the screen y of its top edge.
+        """
+        top = min(cloud.top for cloud in clouds)
+        bottom = max(cloud.bottom for cloud in clouds)
+        strip = pygame.Surface((period, bottom - top), pygame.SRCALPHA)
+        for cloud in clouds:
+            cloud_surface = get_cloud_surface(cloud.size)
+            strip.blit(cloud_surface, (cloud.x, cloud.y - top))
+            # Whatever sticks out past the end of the strip reappears at its start
+            strip.blit(cloud_surface, (cloud.x - period, cloud.y - top))
+        if pygame.display.get_surface() is not None:
+            strip = strip.convert_alpha()
+        return strip, top
+
+    def create_tree_layer(self, width, height, color, ground_height, num_trees, speed, is_foreground=False):
+        """
+        Creates a layer of tree silhouettes standing on a colored ground band.
+        Only the rows the trees can reach are stored, in a transparent strip.
+        """
+        min_tree_height, max_tree_height = FOREGROUND_TREE_HEIGHT_RANGE if is_foreground else TREE_HEIGHT_RANGE
+        ground_top = height - ground_height
+        strip_y = ground_top - max_tree_height - FOLIAGE_RADIUS
+        strip = pygame.Surface((width, ground_top - strip_y), pygame.SRCALPHA)
         
         # Add tree silhouettes
         for _ in range(num_trees):
-            tree_x = random.randint(0, width)
-            tree_height = random.randint(80, 150) if is_foreground else random.randint(50, 100)
-            tree_y = height - ground_height - tree_height
+            tree_x = self.rng.randint(0, width)
+            tree_height = self.rng.randint(min_tree_height, max_tree_height)
+            tree_y = ground_top - tree_height - strip_y
             tree_color = (20, 80, 20)
-            pygame.draw.rect(layer, tree_color, (tree_x, tree_y, 20, tree_height)) # Trunk
-            pygame.draw.circle(layer, tree_color, (tree_x + 10, tree_y), 30) # Foliage
-        return layer
+            pygame.draw.rect(strip, tree_color, (tree_x, tree_y, 20, tree_height)) # Trunk
+            pygame.draw.circle(strip, tree_color, (tree_x + 10, tree_y), FOLIAGE_RADIUS) # Foliage
+        if pygame.display.get_surface() is not None:
+            strip = strip.convert_alpha()
+        return (strip, strip_y, color, ground_height, speed)
+
+    def memory_footprint(self):
+        """Returns the number of bytes held by the background's surfaces."""
+        surfaces = [self.cloud_strip] + [layer[0] for layer in self.layers]
+        return sum(surf.get_width() * surf.get_height() * surf.get_bytesize() for surf in surfaces)
+
+    def get_strip_offsets(self, scroll):
+        """Returns the whole-pixel offset of every scrolling strip at a scroll position."""
+        offsets = [int(scroll * self.cloud_speed) % self.cloud_period]
+        offsets += [int(scroll * layer[4]) % layer[0].get_width() for layer in self.layers]
+        return offsets
+
+    def get_changed_rects(self, old_scroll):
+        """
+        Returns the screen bands whose strips moved by at least a pixel since the
+        background was drawn at `old_scroll`. The slower layers move only every few frames.
+        """
+        if old_scroll is None:
+            return list(self.scrolling_rects)
+        old_offsets = self.get_strip_offsets(old_scroll)
+        new_offsets = self.get_strip_offsets(self.scroll)
+        return [rect for rect, old, new in zip(self.scrolling_rects, old_offsets, new_offsets)
+                if old != new and rect.height]
 
     def update(self, dt):
         """Updates the scroll position."""
         # This will be tied to player movement or a constant scroll later.
         # For now, a slow constant scroll for testing.
-        self.scroll += 50 * dt
+        self.scroll += const.BACKGROUND_SCROLL_SPEED * dt
 
     def draw(self, surface):
         """Draws all layers to the screen, offset by their scroll speed."""
-        surface.fill((135, 206, 235)) # Fill with sky blue first
+        surface.fill(SKY_COLOR) # Fill with sky blue first
         
-        # Draw clouds separately as they are on the base sky layer
-        cloud_speed = self.layers[0][1]
-        for cloud in self.clouds:
-            x_pos = cloud.x - ((self.scroll * cloud_speed) % (const.SCREEN_WIDTH * 2))
-            # If cloud scrolls off left, wrap it around to the right
-            if x_pos < -cloud.width:
-                x_pos += const.SCREEN_WIDTH * 2
-            surface.blit(self.create_cloud_surface(cloud.size), (x_pos, cloud.y))
-
-        for i in range(1, len(self.layers)):
-            layer, speed = self.layers[i]
-            x_pos = -((self.scroll * speed) % layer.get_width())
-            surface.blit(layer, (x_pos, 0))
-            surface.blit(layer, (x_pos + layer.get_width(), 0))
-
-    def create_cloud_surface(self, size):
-        """Creates a simple cloud shape on a surface."""
-        # This is inefficient to call every frame, but fine for a demo.
-        # A better way would be to pre-render these.
-        surf = pygame.Surface(size, pygame.SRCALPHA)
-        pygame.draw.ellipse(surf, (255, 255, 255), (0, 0, size[0], size[1]))
-        return surf 
\ No newline at end of file
+        # Draw clouds separately as they are on the base sky layer. Only the
+        # visible slice of the cloud strip is blitted, wrapping around its end.
+        offsets = self.get_strip_offsets(self.scroll)
+        offset = offsets[0]
+        strip_height = self.cloud_strip.get_height()
+        visible_width = min(const.SCREEN_WIDTH, self.cloud_period - offset)
+        surface.blit(self.cloud_strip, (0, self.cloud_strip_y), (offset, 0, visible_width, strip_height))
+        if visible_width < const.SCREEN_WIDTH:
+            surface.blit(self.cloud_strip, (visible_width, self.cloud_strip_y),
+                         (0, 0, const.SCREEN_WIDTH - visible_width, strip_height))
+
+        for (strip, strip_y, ground_color, ground_height, _), layer_offset in zip(self.layers, offsets[1:]):
+            surface.fill(ground_color, (0, const.SCREEN_HEIGHT - ground_height, const.SCREEN_WIDTH, ground_height))
+            x_pos = -layer_offset
+            surface.blit(strip, (x_pos, strip_y))
+            surface.blit(strip, (x_pos + strip.get_width(), strip_y))
+
+    def restore(self, surface, rects):
+        """
+        Redraws the background only inside the given rects, e.g. where sprites were
+        drawn over it, leaving the rest of the surface untouched.
+        """
+        clip = surface.get_clip()
+        restored = []
+        for rect in rects:
+            if any(done.contains(rect) for done in restored):
+                continue
+            surface.set_clip(rect)
+            self.draw(surface)
+            restored.append(rect)
+        surface.set_clip(clip) 
\ No newline at end of file
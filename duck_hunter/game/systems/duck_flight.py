@@ -0,0 +1,111 @@
+"""
+duck_flight.py
+
+An optional struct-of-arrays backend for flying ducks (const.DUCK_FLIGHT_BACKEND).
+Every flying duck owns one slot in a set of NumPy arrays, and one vectorized
+step advances them all, computes their sine wave offsets and finds the ducks
+that escaped. Sprite rects are only written for ducks that are on screen.
+"""
+import pygame
+import numpy as np
+
+from game.utils import constants as const
+
+# Slot states
+FREE = 0
+FLYING = 1
+
+class DuckFlightSimulation:
+    def __init__(self, capacity=64):
+        """
+        Initializes an empty simulation.
+
+        :param capacity: Number of slots preallocated; the arrays double when full.
+        """
+        self.ducks = [None] * capacity  # slot -> Duck
+        self.free_slots = list(range(capacity - 1, -1, -1))
+        self.count = 0
+        self.allocate_arrays(capacity)
+
+    def allocate_arrays(self, capacity, keep=0):
+        """Allocates the per-slot arrays, copying over the first `keep` slots."""
+        for name, dtype in (("x", np.float64), ("y", np.float64), ("initial_y", np.float64),
+                            ("speed", np.float64), ("amplitude", np.float64), ("frequency", np.float64),
+                            ("half_width", np.int32), ("half_height", np.int32),
+                            ("width", np.int32), ("height", np.int32),
+                            ("state", np.int8), ("synced", np.bool_)):
+            array = np.zeros(capacity, dtype=dtype)
+            if keep:
+                array[:keep] = getattr(self, name)
+            setattr(self, name, array)
+
+    def add(self, duck):
+        """Moves a flying duck's motion into the arrays."""
+        if not self.free_slots:
+            capacity = len(self.ducks)
+            self.allocate_arrays(capacity * 2, keep=capacity)
+            self.ducks.extend([None] * capacity)
+            self.free_slots = list(range(capacity * 2 - 1, capacity - 1, -1))
+
+        slot = self.free_slots.pop()
+        self.ducks[slot] = duck
+        self.x[slot] = duck.pos.x
+        self.y[slot] = duck.pos.y
+        self.initial_y[slot] = duck.initial_y
+        self.speed[slot] = duck.speed
+        self.amplitude[slot] = duck.amplitude
+        self.frequency[slot] = duck.frequency
+        self.width[slot], self.height[slot] = duck.rect.size
+        self.half_width[slot] = duck.rect.width // 2
+        self.half_height[slot] = duck.rect.height // 2
+        self.state[slot] = FLYING
+        self.synced[slot] = False
+        self.count += 1
+
+        duck.flight = self
+        duck.flight_slot = slot
+
+    def remove(self, duck):
+        """Hands a duck's motion back to the sprite, e.g. when it is shot down."""
+        slot = duck.flight_slot
+        duck.pos.update(self.x[slot], self.y[slot])
+        duck.rect.center = duck.pos
+
+        self.state[slot] = FREE
+        self.ducks[slot] = None
+        self.free_slots.append(slot)
+        self.count -= 1
+        duck.flight = None
+        duck.flight_slot = -1
+
+    def step(self, dt):
+        """Advances every flying duck, syncs visible sprites and despawns escaped ducks."""
+        if not self.count:
+            return
+        flying = self.state == FLYING
+
+        # Horizontal movement and vertical sine wave, as in Duck.fly
+        np.add(self.x, self.speed * dt, out=self.x, where=flying)
+        np.multiply(self.frequency, self.x, out=self.y)
+        np.sin(self.y, out=self.y)
+        self.y *= self.amplitude
+        self.y += self.initial_y
+
+        # Rect corners, rounded like assigning the float position to Rect.center
+        left = self.x.astype(np.int32) - self.half_width
+        top = self.y.astype(np.int32) - self.half_height
+        visible = flying & (left < const.SCREEN_WIDTH) & (left + self.width > 0) \
+                  & (top < const.SCREEN_HEIGHT) & (top + self.height > 0)
+
+        # Sprites on screen, or that just left it, get their rect written back
+        sync = np.flatnonzero(visible | (self.synced & flying))
+        ducks = self.ducks
+        for slot, x, y in zip(sync.tolist(), left[sync].tolist(), top[sync].tolist()):
+            ducks[slot].rect.topleft = (x, y)
+        self.synced[:] = visible
+
+        # Despawn ducks that flew off the right edge and tell the game
+        for slot in np.flatnonzero(flying & (left > const.SCREEN_WIDTH)).tolist():
+            duck = ducks[slot]
+            pygame.event.post(pygame.event.Event(pygame.USEREVENT, {'duck': duck}))
+            duck.kill()
@@ -0,0 +1,85 @@
+"""
+entity_registry.py
+
+Keeps the game's entities in one sprite group per kind (flying ducks, falling
+ducks, walking animals, dying animals) next to the group of all sprites.
+Entities move between kinds when their state changes, so each system can
+iterate exactly the set it needs without probing attributes. An optional
+spatial hash of the shootable targets is kept in sync the same way.
+"""
+import pygame
+from game.core.animation import advance_all
+
+FLYING_DUCKS = "flying_ducks"
+FALLING_DUCKS = "falling_ducks"
+WALKING_ANIMALS = "walking_animals"
+DYING_ANIMALS = "dying_animals"
+KINDS = (FLYING_DUCKS, FALLING_DUCKS, WALKING_ANIMALS, DYING_ANIMALS)
+
+# Kinds the player can still shoot
+TARGET_KINDS = (FLYING_DUCKS, WALKING_ANIMALS)
+
+# Kinds whose animation plays; hit and dying animals hold their frame
+ANIMATED_KINDS = (FLYING_DUCKS, FALLING_DUCKS, WALKING_ANIMALS)
+
+class EntityRegistry:
+    def __init__(self):
+        self.all_sprites = pygame.sprite.Group()
+        self.groups = {kind: pygame.sprite.Group() for kind in KINDS}
+        self.flying_ducks = self.groups[FLYING_DUCKS]
+        self.falling_ducks = self.groups[FALLING_DUCKS]
+        self.walking_animals = self.groups[WALKING_ANIMALS]
+        self.dying_animals = self.groups[DYING_ANIMALS]
+        self.targets = [self.groups[kind] for kind in TARGET_KINDS]
+        self.animated = [self.groups[kind] for kind in ANIMATED_KINDS]
+        self.target_grid = None  # SpatialHash of the targets, if the game hit-tests through one
+
+    def add(self, entity):
+        """
+        Registers an entity. Entities declare their kind per state in a
+        `state_kinds` dict, e.g. {"flying": FLYING_DUCKS, "falling": FALLING_DUCKS}.
+        """
+        entity.registry = self
+        kind = entity.state_kinds[entity.state]
+        self.all_sprites.add(entity)
+        self.groups[kind].add(entity)
+        if self.target_grid is not None and kind in TARGET_KINDS:
+            self.target_grid.insert(entity)
+
+    def set_state(self, entity, state):
+        """Changes an entity's state and moves it to the group of its new kind."""
+        old_kind = entity.state_kinds[entity.state]
+        new_kind = entity.state_kinds[state]
+        entity.state = state
+        # A killed entity is in no group and must stay out of them
+        if new_kind != old_kind and entity.alive():
+            self.groups[old_kind].remove(entity)
+            self.groups[new_kind].add(entity)
+            if self.target_grid is not None:
+                if new_kind in TARGET_KINDS:
+                    self.target_grid.insert(entity)
+                else:
+                    self.target_grid.remove(entity)
+
+    def remove(self, entity):
+        """Forgets a killed entity. Its sprite groups have already dropped it."""
+        if self.target_grid is not None:
+            self.target_grid.remove(entity)
+
+    def update_target_grid(self):
+        """Moves the targets that crossed into another cell of the target grid."""
+        if self.target_grid is not None:
+            for group in self.targets:
+                self.target_grid.update(group)
+
+    def advance_animations(self, dt):
+        """
+        Advances the animation of every registered entity whose kind animates, in
+        one batch. Registered entities leave their animation to this in update().
+        """
+        advance_all([entity.animation for group in self.animated for entity in group], dt)
+
+    def empty(self):
+        """Kills every entity, which also returns pooled entities to their pools."""
+        for entity in self.all_sprites.sprites():
+            entity.kill()
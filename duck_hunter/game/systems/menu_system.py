@@ -5,7 +5,7 @@ Handles all menu states, transitions, and user interface elements.
 """
 import pygame
 from game.utils import constants as const
-from game.systems.background import ParallaxBackground
+from game.systems.background import get_shared_background
 
 class Button:
     def __init__(self, x, y, width, height, text, font, callback=None):
@@ -16,13 +16,46 @@ class Button:
         scaled_height = int(height * const.UI_SCALE)
         
         self.rect = pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
-        self.text = text
         self.font = font
         self.callback = callback
         self.hovered = False
         self.normal_color = (100, 100, 100)
         self.hover_color = (150, 150, 150)
         self.text_color = const.WHITE
+        self.text = text
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        # The label is baked into the cached images, so they are rebuilt lazily
+        self._text = value
+        self.normal_image = None
+        self.hover_image = None
+        self.image_rect = None
+
+    def render_images(self):
+        """
+        Pre-renders the normal and hover images. Labels wider than the button
+        overflow its face, so the images cover the union of both. The images
+        are premultiplied and must be blitted with BLEND_PREMULTIPLIED.
+        """
+        text_surface = self.font.render(self.text, True, self.text_color).premul_alpha()
+        text_rect = text_surface.get_rect(center=self.rect.center)
+        self.image_rect = self.rect.union(text_rect)
+        face_rect = self.rect.move(-self.image_rect.x, -self.image_rect.y)
+        text_pos = text_rect.move(-self.image_rect.x, -self.image_rect.y)
+        
+        images = []
+        for color in (self.normal_color, self.hover_color):
+            image = pygame.Surface(self.image_rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(image, color, face_rect)
+            pygame.draw.rect(image, const.WHITE, face_rect, 2)
+            image.blit(text_surface, text_pos, special_flags=pygame.BLEND_PREMULTIPLIED)
+            images.append(image)
+        self.normal_image, self.hover_image = images
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -36,19 +69,22 @@ class Button:
         self.hovered = self.rect.collidepoint(mouse_pos)
 
     def draw(self, surface):
-        color = self.hover_color if self.hovered else self.normal_color
-        pygame.draw.rect(surface, color, self.rect)
-        pygame.draw.rect(surface, const.WHITE, self.rect, 2)
-        
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        if self.normal_image is None:
+            self.render_images()
+        image = self.hover_image if self.hovered else self.normal_image
+        surface.blit(image, self.image_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
 
 class MenuSystem:
     def __init__(self, screen):
         self.screen = screen
         self.current_state = "main_menu"
-        self.background = ParallaxBackground()
+        self.background = get_shared_background()
+        self.final_score = 0
+        
+        # Pre-composited menu content, rebuilt only when layer_key changes
+        self.menu_layer = None
+        self.menu_layer_rect = None
+        self.menu_layer_key = None
         
         # Scale font sizes based on display scaling
         base_font_size = int(48 * const.UI_SCALE)
@@ -210,23 +246,77 @@ class MenuSystem:
             for button in self.mode_selection_buttons:
                 button.update(mouse_pos)
 
+    def get_current_buttons(self):
+        """Returns the buttons of the current menu state."""
+        return {
+            "main_menu": self.main_menu_buttons,
+            "game_over": self.game_over_buttons,
+            "settings": self.settings_buttons,
+            "high_scores": self.high_scores_buttons,
+            "mode_selection": self.mode_selection_buttons
+        }.get(self.current_state, [])
+
     def draw(self, final_score=0):
-        """Draws the current menu state."""
+        """
+        Draws the current menu state. Returns the screen region whose menu content
+        changed since the last call, or None if it is unchanged.
+        """
         # Draw background
         self.background.draw(self.screen)
         
+        # Everything in front of the background only changes with the state,
+        # the hovered button, a button label or the score shown
+        buttons = self.get_current_buttons()
+        layer_key = (self.current_state, final_score,
+                     tuple(button.hovered for button in buttons),
+                     tuple(button.text for button in buttons))
+        changed_rect = None
+        if layer_key != self.menu_layer_key:
+            old_rect = self.menu_layer_rect
+            self.build_menu_layer(final_score)
+            self.menu_layer_key = layer_key
+            # Both where the old layer was and where the new one is
+            rects = [rect for rect in (old_rect, self.menu_layer_rect) if rect is not None]
+            changed_rect = rects[0].unionall(rects[1:]) if rects else self.screen.get_rect()
+        
+        if self.menu_layer is not None:
+            self.screen.blit(self.menu_layer, self.menu_layer_rect,
+                             special_flags=pygame.BLEND_PREMULTIPLIED)
+        return changed_rect
+
+    def build_menu_layer(self, final_score):
+        """
+        Composites the current menu's titles, panels and buttons into one surface.
+        The layer is kept premultiplied so translucent panels and antialiased
+        text blend onto the background exactly as if drawn directly.
+        """
+        layer = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        
         if self.current_state == "main_menu":
-            self.draw_main_menu()
+            self.draw_main_menu(layer)
         elif self.current_state == "game_over":
-            self.draw_game_over_menu(final_score)
+            self.draw_game_over_menu(layer, final_score)
         elif self.current_state == "settings":
-            self.draw_settings_menu()
+            self.draw_settings_menu(layer)
         elif self.current_state == "high_scores":
-            self.draw_high_scores_menu()
+            self.draw_high_scores_menu(layer)
         elif self.current_state == "mode_selection":
-            self.draw_mode_selection_menu()
+            self.draw_mode_selection_menu(layer)
+        
+        # Crop to the drawn content so the per-frame blit stays small
+        bounding_rect = layer.get_bounding_rect()
+        if bounding_rect.width == 0 or bounding_rect.height == 0:
+            self.menu_layer = None
+            self.menu_layer_rect = None
+            return
+        self.menu_layer = layer.subsurface(bounding_rect).copy()
+        self.menu_layer_rect = bounding_rect
+
+    def compose(self, layer, source, dest):
+        """Blends a straight-alpha surface onto the premultiplied menu layer."""
+        layer.blit(source.premul_alpha(), dest, special_flags=pygame.BLEND_PREMULTIPLIED)
 
-    def draw_main_menu(self):
+    def draw_main_menu(self, surface):
         """Draws the main menu."""
         # Title - use scaled coordinates
         title_text = self.title_font.render("DUCK HUNTER", True, const.WHITE)
@@ -241,14 +331,14 @@ class MenuSystem:
         bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
         bg_surface.fill((0, 0, 0, 150))
         
-        self.screen.blit(bg_surface, bg_rect)
-        self.screen.blit(title_text, title_rect)
+        self.compose(surface, bg_surface, bg_rect)
+        self.compose(surface, title_text, title_rect)
         
         # Draw buttons
         for button in self.main_menu_buttons:
-            button.draw(self.screen)
+            button.draw(surface)
 
-    def draw_game_over_menu(self, final_score):
+    def draw_game_over_menu(self, surface, final_score):
         """Draws the game over screen."""
         # Game Over text - use scaled coordinates
         game_over_text = self.title_font.render("GAME OVER", True, const.WHITE)
@@ -269,14 +359,14 @@ class MenuSystem:
             bg_rect = rect.inflate(bg_padding_x, bg_padding_y)
             bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
             bg_surface.fill((0, 0, 0, 150))
-            self.screen.blit(bg_surface, bg_rect)
-            self.screen.blit(text, rect)
+            self.compose(surface, bg_surface, bg_rect)
+            self.compose(surface, text, rect)
         
         # Draw buttons
         for button in self.game_over_buttons:
-            button.draw(self.screen)
+            button.draw(surface)
 
-    def draw_settings_menu(self):
+    def draw_settings_menu(self, surface):
         """Draws the settings menu."""
         # Title - use scaled coordinates
         title_text = self.title_font.render("SETTINGS", True, const.WHITE)
@@ -291,14 +381,14 @@ class MenuSystem:
         bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
         bg_surface.fill((0, 0, 0, 150))
         
-        self.screen.blit(bg_surface, bg_rect)
-        self.screen.blit(title_text, title_rect)
+        self.compose(surface, bg_surface, bg_rect)
+        self.compose(surface, title_text, title_rect)
         
         # Draw buttons
         for button in self.settings_buttons:
-            button.draw(self.screen)
+            button.draw(surface)
 
-    def draw_high_scores_menu(self):
+    def draw_high_scores_menu(self, surface):
         """Draws the high scores menu."""
         # Title - use scaled coordinates
         title_text = self.title_font.render("HIGH SCORES", True, const.WHITE)
@@ -313,8 +403,8 @@ class MenuSystem:
         bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
         bg_surface.fill((0, 0, 0, 150))
         
-        self.screen.blit(bg_surface, bg_rect)
-        self.screen.blit(title_text, title_rect)
+        self.compose(surface, bg_surface, bg_rect)
+        self.compose(surface, title_text, title_rect)
         
         # No scores message - use scaled coordinates
         no_scores_text = self.font.render("No scores yet!", True, const.WHITE)
@@ -326,14 +416,14 @@ class MenuSystem:
         bg_surface2 = pygame.Surface(bg_rect2.size, pygame.SRCALPHA)
         bg_surface2.fill((0, 0, 0, 150))
         
-        self.screen.blit(bg_surface2, bg_rect2)
-        self.screen.blit(no_scores_text, no_scores_rect)
+        self.compose(surface, bg_surface2, bg_rect2)
+        self.compose(surface, no_scores_text, no_scores_rect)
         
         # Draw buttons
         for button in self.high_scores_buttons:
-            button.draw(self.screen)
+            button.draw(surface)
 
-    def draw_mode_selection_menu(self):
+    def draw_mode_selection_menu(self, surface):
         """Draws the mode selection menu."""
         # Title - use scaled coordinates
         title_text = self.title_font.render("SELECT GAME MODE", True, const.WHITE)
@@ -348,12 +438,12 @@ class MenuSystem:
         bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
         bg_surface.fill((0, 0, 0, 150))
         
-        self.screen.blit(bg_surface, bg_rect)
-        self.screen.blit(title_text, title_rect)
+        self.compose(surface, bg_surface, bg_rect)
+        self.compose(surface, title_text, title_rect)
         
         # Draw buttons
         for button in self.mode_selection_buttons:
-            button.draw(self.screen)
+            button.draw(surface)
         
         # Draw mode descriptions
         descriptions = [
@@ -366,7 +456,7 @@ class MenuSystem:
         for i, desc in enumerate(descriptions):
             desc_text = self.font.render(desc, True, const.WHITE)
             desc_rect = desc_text.get_rect(center=(const.SCREEN_WIDTH//2, 300 + i * 70 + 25))
-            self.screen.blit(desc_text, desc_rect)
+            self.compose(surface, desc_text, desc_rect)
 
     # Button callbacks
     def start_game(self):
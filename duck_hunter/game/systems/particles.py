@@ -2,51 +2,246 @@
 particles.py
 
 Manages particle effects for visuals like explosions, smoke, and sparkles.
+Particles live in a fixed-capacity pool backed by one NumPy structured array:
+emitters claim slots from a free-list, expired particles return them, and
+nothing is allocated per particle. Particles are moved and culled with
+vectorized operations and drawn from a few cached stamps (one per size and
+color) with a single Surface.fblits call.
 """
+import gc
 import pygame
-import random
-
-class Particle(pygame.sprite.Sprite):
-    def __init__(self, pos, color, size, velocity, lifetime):
-        super().__init__()
-        self.image = pygame.Surface((size, size))
-        pygame.draw.circle(self.image, color, (size // 2, size // 2), size // 2)
-        self.rect = self.image.get_rect(center=pos)
-        self.pos = pygame.math.Vector2(pos)
-        self.velocity = pygame.math.Vector2(velocity)
-        self.lifetime = lifetime
-        self.age = 0
+import numpy as np
 
-    def update(self, dt):
-        self.pos += self.velocity * dt
-        self.rect.center = self.pos
-        self.age += dt
-        if self.age >= self.lifetime:
-            self.kill()
+from game.utils import constants as const
+from game.core.rng import random_service
+
+PARTICLE_DTYPE = np.dtype([
+    ("pos", np.float64, 2),
+    ("vel", np.float64, 2),
+    ("age", np.float64),
+    ("lifetime", np.float64),
+    ("size", np.int32),
+    ("color", np.int32),  # index into ParticleSystem.colors
+    ("stamp", np.int32),  # index into ParticleSystem.stamps
+    ("alive", np.bool_),
+])
+
+# What emit does when the pool has fewer free slots than requested
+DROP_OLDEST = "drop_oldest"  # Recycle the slots of the oldest live particles
+DROP_NEW = "drop_new"        # Emit only as many particles as there are free slots
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEW)
+
+def create_particle_stamp(size, color):
+    """Draws the image shared by every particle of a size and color."""
+    stamp = pygame.Surface((size, size))
+    pygame.draw.circle(stamp, color, (size // 2, size // 2), size // 2)
+    if pygame.display.get_surface():
+        # Opaque and in the display format, the fastest kind of surface to blit
+        stamp = stamp.convert()
+    return stamp
+
+def get_gc_collections():
+    """Returns the number of garbage collections run so far, over all generations."""
+    return sum(generation["collections"] for generation in gc.get_stats())
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles = pygame.sprite.Group()
+    def __init__(self, capacity=const.PARTICLE_CAPACITY, overflow_policy=const.PARTICLE_OVERFLOW_POLICY, rng=None):
+        """
+        Initializes an empty particle pool.
+
+        :param capacity: Maximum number of live particles.
+        :param overflow_policy: DROP_OLDEST or DROP_NEW, applied when the pool is full.
+        :param rng: The RandomService to draw particle properties from. Defaults to the shared one.
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown particle overflow policy: {overflow_policy}")
+        self.capacity = capacity
+        self.overflow_policy = overflow_policy
+        self.particles = np.zeros(capacity, dtype=PARTICLE_DTYPE)
+        self.rng = (rng or random_service).numpy
+
+        # Free-list: a stack of free slot indices, the top being free_slots[free_count - 1]
+        self.free_slots = np.arange(capacity - 1, -1, -1, dtype=np.int32)
+        self.free_count = capacity
+
+        # Scratch buffers reused every update
+        self.step = np.zeros((capacity, 2))
+        self.expired = np.zeros(capacity, dtype=np.bool_)
+
+        self.colors = []
+        self.color_indices = {}  # color -> index into colors
+        self.stamps = []
+        self.stamp_indices = {}  # (size, color index) -> index into stamps
+
+        # Counters, see get_stats
+        self.high_water = 0
+        self.emitted = 0
+        self.evicted = 0  # Live particles killed early to make room (DROP_OLDEST)
+        self.dropped = 0  # New particles never emitted for lack of room
+        self.allocations = 1  # The pool itself; afterwards only new stamps count
+        self.gc_collections_at_start = get_gc_collections()
+
+    @property
+    def count(self):
+        """Number of live particles."""
+        return self.capacity - self.free_count
+
+    def get_color_index(self, color):
+        """Returns the palette index of a color, adding it if needed."""
+        color = tuple(color)
+        index = self.color_indices.get(color)
+        if index is None:
+            index = self.color_indices[color] = len(self.colors)
+            self.colors.append(color)
+        return index
+
+    def get_stamp_index(self, size, color_index):
+        """Returns the index of the stamp drawing a particle of a size and color."""
+        key = (size, color_index)
+        index = self.stamp_indices.get(key)
+        if index is None:
+            index = self.stamp_indices[key] = len(self.stamps)
+            self.stamps.append(create_particle_stamp(size, self.colors[color_index]))
+            self.allocations += 1
+        return index
+
+    def claim(self, count):
+        """
+        Takes slots for count new particles from the free-list, applying the
+        overflow policy if there are not enough. Returns the claimed slot indices.
+        """
+        if count > self.free_count:
+            if self.overflow_policy == DROP_OLDEST:
+                self.release_oldest(min(count, self.capacity) - self.free_count)
+            dropped = count - self.free_count
+            self.dropped += dropped
+            count -= dropped
+
+        slots = self.free_slots[self.free_count - count:self.free_count].copy()
+        self.free_count -= count
+        self.particles["alive"][slots] = True
+        self.high_water = max(self.high_water, self.count)
+        return slots
+
+    def release(self, slots):
+        """Returns the slots of dead particles to the free-list."""
+        self.particles["alive"][slots] = False
+        self.free_slots[self.free_count:self.free_count + len(slots)] = slots
+        self.free_count += len(slots)
+
+    def release_oldest(self, count):
+        """Kills the count live particles that have been alive the longest."""
+        live = np.flatnonzero(self.particles["alive"])
+        if count < len(live):
+            ages = self.particles["age"][live]
+            live = live[np.argpartition(ages, len(live) - count)[len(live) - count:]]
+        self.evicted += len(live)
+        self.release(live)
+
+    def emit(self, pos, count, color, size_range, velocity_x_range, velocity_y_range, lifetime_range):
+        """
+        Emits a burst of particles from one point.
+
+        :param pos: The (x, y) the particles start from.
+        :param count: Number of particles.
+        :param color: The RGB color of the particles.
+        :param size_range: Inclusive (min, max) particle size in pixels.
+        :param velocity_x_range: (min, max) horizontal velocity in pixels per second.
+        :param velocity_y_range: (min, max) vertical velocity in pixels per second.
+        :param lifetime_range: (min, max) lifetime in seconds.
+        """
+        slots = self.claim(count)
+        count = len(slots)
+        if not count:
+            return
+        self.emitted += count
+
+        rng = self.rng
+        particles = self.particles
+        particles["pos"][slots] = pos
+        particles["vel"][slots, 0] = rng.uniform(*velocity_x_range, count)
+        particles["vel"][slots, 1] = rng.uniform(*velocity_y_range, count)
+        particles["age"][slots] = 0
+        particles["lifetime"][slots] = rng.uniform(*lifetime_range, count)
+        sizes = rng.integers(size_range[0], size_range[1] + 1, count)
+        particles["size"][slots] = sizes
+
+        color_index = self.get_color_index(color)
+        particles["color"][slots] = color_index
+        # Few distinct sizes exist, so the stamp lookup runs per size, not per particle
+        for size in np.unique(sizes).tolist():
+            particles["stamp"][slots[sizes == size]] = self.get_stamp_index(size, color_index)
 
     def emit_feathers(self, pos):
         """Emits a burst of 'feather' particles."""
-        from game.utils import constants as const
-        
         feather_color = (255, 255, 255) # White
-        for _ in range(20): # Number of feathers
-            vel = (random.uniform(-150, 150), random.uniform(-200, 0))
-            # Scale particle size based on display scaling
-            min_size = max(1, int(2 * const.UI_SCALE))
-            max_size = max(1, int(5 * const.UI_SCALE))
-            size = random.randint(min_size, max_size)
-            lifetime = random.uniform(0.5, 1.5)
-            particle = Particle(pos, feather_color, size, vel, lifetime)
-            self.particles.add(particle)
+        # Scale particle size based on display scaling
+        min_size = max(1, int(2 * const.UI_SCALE))
+        max_size = max(1, int(5 * const.UI_SCALE))
+        self.emit(pos, 20, feather_color, (min_size, max_size), (-150, 150), (-200, 0), (0.5, 1.5))
 
     def update(self, dt):
         """Update all active particles."""
-        self.particles.update(dt)
+        if not self.count:
+            return
+        # The whole pool is integrated in place; dead slots are simply never drawn
+        particles = self.particles
+        np.multiply(particles["vel"], dt, out=self.step)
+        particles["pos"] += self.step
+        particles["age"] += dt
+
+        np.greater_equal(particles["age"], particles["lifetime"], out=self.expired)
+        self.expired &= particles["alive"]
+        if self.expired.any():
+            self.release(np.flatnonzero(self.expired))
+
+    def get_live_slots(self):
+        """Returns the slot indices of the live particles."""
+        return np.flatnonzero(self.particles["alive"])
+
+    def get_topleft_positions(self, slots):
+        """Returns the integer left and top coordinates of the given particles' rects."""
+        particles = self.particles
+        half_size = particles["size"][slots] // 2
+        # Same rounding as assigning the float position to Rect.center
+        left = particles["pos"][slots, 0].astype(np.int32) - half_size
+        top = particles["pos"][slots, 1].astype(np.int32) - half_size
+        return left, top
+
+    def bounding_rect(self):
+        """Returns a rect covering all active particles, or None if there are none."""
+        if not self.count:
+            return None
+        slots = self.get_live_slots()
+        left, top = self.get_topleft_positions(slots)
+        size = self.particles["size"][slots]
+        x, y = int(left.min()), int(top.min())
+        right, bottom = int((left + size).max()), int((top + size).max())
+        return pygame.Rect(x, y, right - x, bottom - y)
+
+    def get_stats(self):
+        """
+        Returns the pool counters. In steady state 'allocations' stays constant
+        and 'gc_collections' should not grow because of particles. 'evicted' counts
+        live particles recycled under DROP_OLDEST, 'dropped' emissions that were refused.
+        """
+        return {
+            "capacity": self.capacity,
+            "live": self.count,
+            "high_water": self.high_water,
+            "emitted": self.emitted,
+            "evicted": self.evicted,
+            "dropped": self.dropped,
+            "allocations": self.allocations,
+            "gc_collections": get_gc_collections() - self.gc_collections_at_start,
+        }
 
     def draw(self, surface):
         """Render all active particles."""
-        self.particles.draw(surface) 
\ No newline at end of file
+        if not self.count:
+            return
+        slots = self.get_live_slots()
+        left, top = self.get_topleft_positions(slots)
+        stamps = map(self.stamps.__getitem__, self.particles["stamp"][slots].tolist())
+        # Feed fblits lazily: building a list of 10k position tuples costs more than the blits
+        surface.fblits(zip(stamps, zip(left.tolist(), top.tolist())))
@@ -0,0 +1,97 @@
+"""
+spatial_hash.py
+
+A uniform grid hashing entities by their rect center, so that finding the
+entities near a position only looks at a few cells instead of every entity.
+Used to hit-test shots against the live targets. Positions are read from the
+entities when queried, so an entity only needs re-bucketing when it crosses
+into another cell.
+"""
+
+class SpatialHash:
+    def __init__(self, cell_size):
+        """
+        Initializes an empty grid.
+
+        :param cell_size: Width and height of a cell in pixels. Queries are cheapest
+                          when it is about twice the query radius.
+        """
+        self.cell_size = cell_size
+        self.cells = {}          # (cell_x, cell_y) -> {entity: None}, insertion ordered
+        self.entity_cells = {}   # entity -> (cell_x, cell_y)
+
+    def __len__(self):
+        return len(self.entity_cells)
+
+    def __contains__(self, entity):
+        return entity in self.entity_cells
+
+    def __iter__(self):
+        return iter(list(self.entity_cells))
+
+    def cell_of(self, pos):
+        return (int(pos[0] // self.cell_size), int(pos[1] // self.cell_size))
+
+    def insert(self, entity):
+        """Adds an entity in the cell of its rect center."""
+        cell = self.cell_of(entity.rect.center)
+        if self.entity_cells.get(entity) != cell:
+            self.move(entity, cell)
+
+    def move(self, entity, cell):
+        """Puts an entity into a cell, taking it out of its old one."""
+        self.remove(entity)
+        self.cells.setdefault(cell, {})[entity] = None
+        self.entity_cells[entity] = cell
+
+    def update(self, entities):
+        """Moves the given entities whose rect center crossed into another cell."""
+        entity_cells = self.entity_cells
+        cell_size = self.cell_size
+        for entity in entities:
+            x, y = entity.rect.center
+            cell = (int(x // cell_size), int(y // cell_size))
+            if cell != entity_cells[entity]:
+                self.move(entity, cell)
+
+    def remove(self, entity):
+        """Removes an entity; unknown entities are ignored."""
+        cell = self.entity_cells.pop(entity, None)
+        if cell is None:
+            return
+        members = self.cells[cell]
+        del members[entity]
+        if not members:
+            del self.cells[cell]
+
+    def clear(self):
+        self.cells.clear()
+        self.entity_cells.clear()
+
+    def query_nearest(self, pos, radius):
+        """
+        Returns the entity closest to pos within radius, or None.
+        Only the cells overlapping the circle's bounding box are visited and
+        distances are compared squared.
+        """
+        x, y = pos
+        radius_squared = radius * radius
+        min_cell_x, min_cell_y = self.cell_of((x - radius, y - radius))
+        max_cell_x, max_cell_y = self.cell_of((x + radius, y + radius))
+
+        nearest = None
+        nearest_distance = radius_squared
+        for cell_x in range(min_cell_x, max_cell_x + 1):
+            for cell_y in range(min_cell_y, max_cell_y + 1):
+                members = self.cells.get((cell_x, cell_y))
+                if not members:
+                    continue
+                for entity in members:
+                    entity_x, entity_y = entity.rect.center
+                    dx = entity_x - x
+                    dy = entity_y - y
+                    distance = dx * dx + dy * dy
+                    if distance < nearest_distance or (distance == nearest_distance and nearest is None):
+                        nearest = entity
+                        nearest_distance = distance
+        return nearest
@@ -31,56 +31,93 @@ class UISystem:
         # FPS tracking
         self.fps_history = []
         self.fps_display = 60
+        
+        # Translucent text backgrounds, one per size
+        self.backdrop_cache = {}
+
+    def get_text_backdrop(self, size):
+        """Returns a shared translucent background surface of the given size."""
+        backdrop = self.backdrop_cache.get(size)
+        if backdrop is None:
+            backdrop = pygame.Surface(size, pygame.SRCALPHA)
+            backdrop.fill((0, 0, 0, 100))
+            self.backdrop_cache[size] = backdrop
+        return backdrop
+
+    def compose_field(self, font, label, value, color, **anchor):
+        """
+        Lays out a label from the text cache followed by a numeric value drawn
+        from the digit glyph atlas, so changing numbers never rasterize glyphs.
+        Values the atlas cannot draw (e.g. "∞") are rendered as plain text.
+
+        :param anchor: One rect position keyword, e.g. topleft=(x, y).
+        :return: A tuple (blit_sequence, rect) for Surface.blits.
+        """
+        glyphs = resources.get_glyph_atlas(font, color)
+        if not glyphs.can_render(value):
+            text_surface = resources.render_text(font, label + value, color)
+            text_rect = text_surface.get_rect(**anchor)
+            return [(text_surface, text_rect)], text_rect
+        
+        label_surface = resources.render_text(font, label, color)
+        label_width = label_surface.get_width()
+        text_rect = pygame.Rect(0, 0, label_width + glyphs.measure(value), max(label_surface.get_height(), glyphs.height))
+        for name, pos in anchor.items():
+            setattr(text_rect, name, pos)
+        sequence = [(label_surface, text_rect.topleft)]
+        sequence += glyphs.layout(value, (text_rect.x + label_width, text_rect.y))
+        return sequence, text_rect
 
     def draw_score(self, surface, score):
         """Renders the current score to the screen."""
-        score_text = f"Score: {score}"
-        text_surface = self.font.render(score_text, True, const.WHITE)
         # Scale the position based on the UI scaling factor
         x_pos = int(20 * const.UI_SCALE)
         y_pos = int(20 * const.UI_SCALE)
-        text_rect = text_surface.get_rect(topleft=(x_pos, y_pos))
-        surface.blit(text_surface, text_rect)
+        sequence, text_rect = self.compose_field(self.font, "Score: ", str(score), const.WHITE, topleft=(x_pos, y_pos))
+        surface.blits(sequence, doreturn=False)
+        return text_rect
 
     def draw_lives(self, surface, lives):
         """Renders the current lives to the screen."""
         if lives == float('inf'):
-            lives_text = "Lives: ∞"
+            lives_text = "∞"
         else:
-            lives_text = f"Lives: {lives}"
-        text_surface = self.font.render(lives_text, True, const.WHITE)
+            lives_text = str(lives)
         # Scale the position based on the UI scaling factor
-        x_pos = const.SCREEN_WIDTH - int(20 * const.UI_SCALE) - text_surface.get_width()
+        x_pos = const.SCREEN_WIDTH - int(20 * const.UI_SCALE)
         y_pos = int(20 * const.UI_SCALE)
-        text_rect = text_surface.get_rect(topleft=(x_pos, y_pos))
-        surface.blit(text_surface, text_rect)
+        sequence, text_rect = self.compose_field(self.font, "Lives: ", lives_text, const.WHITE, topright=(x_pos, y_pos))
+        surface.blits(sequence, doreturn=False)
+        return text_rect
 
     def draw_ammo(self, surface, weapon_data):
         """Renders the current ammo status to the screen."""
+        label = "Ammo: "
         if weapon_data.current_ammo == float('inf') or weapon_data.ammo_capacity == float('inf'):
-            ammo_text = "Ammo: ∞"
+            ammo_text = "∞"
         else:
-            ammo_text = f"Ammo: {weapon_data.current_ammo}/{weapon_data.ammo_capacity}"
+            ammo_text = f"{weapon_data.current_ammo}/{weapon_data.ammo_capacity}"
         
         if weapon_data.is_reloading and weapon_data.current_ammo != float('inf'):
-            ammo_text = "Reloading..."
+            label, ammo_text = "Reloading...", ""
         
-        text_surface = self.font.render(ammo_text, True, const.WHITE)
         # Scale the position based on the UI scaling factor
         x_pos = int(20 * const.UI_SCALE)
-        y_pos = const.SCREEN_HEIGHT - int(20 * const.UI_SCALE) - text_surface.get_height()
-        text_rect = text_surface.get_rect(topleft=(x_pos, y_pos))
-        surface.blit(text_surface, text_rect)
+        y_pos = const.SCREEN_HEIGHT - int(20 * const.UI_SCALE)
+        sequence, text_rect = self.compose_field(self.font, label, ammo_text, const.WHITE, bottomleft=(x_pos, y_pos))
+        surface.blits(sequence, doreturn=False)
+        return text_rect
 
     def draw_game_mode(self, surface, game_mode):
         """Renders the current game mode to the screen."""
         mode_text = f"Mode: {game_mode.upper()}"
-        text_surface = self.font.render(mode_text, True, const.WHITE)
+        text_surface = resources.render_text(self.font, mode_text, const.WHITE)
         # Scale the position based on the UI scaling factor
         x_pos = const.SCREEN_WIDTH - int(20 * const.UI_SCALE) - text_surface.get_width()
         y_pos = const.SCREEN_HEIGHT - int(20 * const.UI_SCALE) - text_surface.get_height()
         text_rect = text_surface.get_rect(topleft=(x_pos, y_pos))
         surface.blit(text_surface, text_rect)
+        return text_rect
 
     def draw_timer(self, surface, elapsed_time, time_limit):
         """Renders the timer for God Mode."""
@@ -88,7 +125,7 @@ class UISystem:
             remaining_time = max(0, time_limit - elapsed_time)
             minutes = int(remaining_time // 60)
             seconds = int(remaining_time % 60)
-            timer_text = f"Time: {minutes:02d}:{seconds:02d}"
+            timer_text = f"{minutes:02d}:{seconds:02d}"
             
             # Color changes as time runs out
             if remaining_time < 30:
@@ -98,19 +135,18 @@ class UISystem:
             else:
                 color = const.WHITE
             
-            text_surface = self.small_font.render(timer_text, True, color)
             # Scale the position based on the UI scaling factor
-            x_pos = const.SCREEN_WIDTH - int(20 * const.UI_SCALE) - text_surface.get_width()
-            y_pos = const.SCREEN_HEIGHT - int(60 * const.UI_SCALE) - text_surface.get_height()
-            text_rect = text_surface.get_rect(topleft=(x_pos, y_pos))
+            x_pos = const.SCREEN_WIDTH - int(20 * const.UI_SCALE)
+            y_pos = const.SCREEN_HEIGHT - int(60 * const.UI_SCALE)
+            sequence, text_rect = self.compose_field(self.small_font, "Time: ", timer_text, color, bottomright=(x_pos, y_pos))
             
             # Add background for better readability
             bg_rect = text_rect.inflate(int(8 * const.UI_SCALE), int(4 * const.UI_SCALE))
-            bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-            bg_surface.fill((0, 0, 0, 100))
+            bg_surface = self.get_text_backdrop(bg_rect.size)
             
-            surface.blit(bg_surface, bg_rect)
-            surface.blit(text_surface, text_rect)
+            surface.blits([(bg_surface, bg_rect)] + sequence, doreturn=False)
+            return bg_rect
+        return None
 
     def update_fps(self, dt):
         """Updates the FPS counter with smooth averaging."""
@@ -127,29 +163,28 @@ class UISystem:
 
     def draw_fps(self, surface):
         """Renders the FPS counter in a tasteful way."""
-        fps_text = f"FPS: {int(self.fps_display)}"
-        text_surface = self.small_font.render(fps_text, True, const.WHITE)
-        
         # Position in top-left corner, below the score
-        text_rect = text_surface.get_rect(topleft=(20, 60))
+        sequence, text_rect = self.compose_field(self.small_font, "FPS: ", str(int(self.fps_display)), const.WHITE, topleft=(20, 60))
         
         # Add a subtle background for better readability
         bg_rect = text_rect.inflate(8, 4)
-        bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 100))
+        bg_surface = self.get_text_backdrop(bg_rect.size)
         
-        surface.blit(bg_surface, bg_rect)
-        surface.blit(text_surface, text_rect)
+        surface.blits([(bg_surface, bg_rect)] + sequence, doreturn=False)
+        return bg_rect
 
     def update(self, dt, game_state):
         """Updates UI elements based on game state."""
         self.update_fps(dt)
 
     def draw(self, surface, player_data, elapsed_time=0, time_limit=0):
-        """Renders all UI elements."""
-        self.draw_score(surface, player_data.score)
-        self.draw_fps(surface)
-        self.draw_lives(surface, player_data.lives)
-        self.draw_ammo(surface, player_data.weapon)
-        self.draw_game_mode(surface, player_data.game_mode)
-        self.draw_timer(surface, elapsed_time, time_limit) 
\ No newline at end of file
+        """Renders all UI elements and returns the screen rects they cover."""
+        rects = [
+            self.draw_score(surface, player_data.score),
+            self.draw_fps(surface),
+            self.draw_lives(surface, player_data.lives),
+            self.draw_ammo(surface, player_data.weapon),
+            self.draw_game_mode(surface, player_data.game_mode),
+            self.draw_timer(surface, elapsed_time, time_limit)
+        ]
+        return [rect for rect in rects if rect is not None] 
\ No newline at end of file
@@ -6,21 +6,38 @@ Centralizing these values makes them easy to find, modify, and manage.
 Using constants avoids magic numbers and ensures consistency across the codebase.
 """
 
+import os
 import pygame
 
 # Base design resolution (what the game was designed for)
 DESIGN_WIDTH = 1920
 DESIGN_HEIGHT = 1080
 
+# Headless mode (DUCK_HUNTER_HEADLESS=1 or main.py --headless) runs without a window or
+# sound card, on SDL's dummy drivers, at a virtual resolution of "WIDTHxHEIGHT".
+# HEADLESS_RENDER is "none" to skip drawing or "offscreen" to draw every frame off screen.
+HEADLESS = os.environ.get("DUCK_HUNTER_HEADLESS", "0") not in ("", "0")
+HEADLESS_RESOLUTION = os.environ.get("DUCK_HUNTER_RESOLUTION", f"{DESIGN_WIDTH}x{DESIGN_HEIGHT}")
+HEADLESS_RENDER = os.environ.get("DUCK_HUNTER_RENDER", "none")
+
+if HEADLESS:
+    # Must be set before pygame.init(); explicit driver choices still win
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
 # Get actual screen size and calculate scaling
 def get_display_info():
     """Get the actual display resolution and calculate scaling factors."""
     pygame.init()
-    display_info = pygame.display.Info()
     
-    # Get the actual screen resolution
-    actual_width = display_info.current_w
-    actual_height = display_info.current_h
+    if HEADLESS:
+        # There is no real display to measure
+        actual_width, actual_height = (int(value) for value in HEADLESS_RESOLUTION.lower().split("x"))
+    else:
+        # Get the actual screen resolution
+        display_info = pygame.display.Info()
+        actual_width = display_info.current_w
+        actual_height = display_info.current_h
     
     # Calculate scaling factors
     scale_x = actual_width / DESIGN_WIDTH
@@ -56,6 +73,50 @@ UI_SCALE = DISPLAY_INFO['scale']
 # FPS
 FPS = 60
 
+# Menus and the pause screen drop to IDLE_FPS after IDLE_GRACE_PERIOD seconds without input.
+# With IDLE_WAIT_FOR_EVENTS the idle loop checks for queued input while it sleeps and wakes on it.
+IDLE_FPS = 12
+IDLE_GRACE_PERIOD = 1.0
+IDLE_WAIT_FOR_EVENTS = True
+
+# Gameplay is simulated in fixed steps of 1 / SIM_HZ seconds, independent of the frame rate.
+# At most MAX_SIM_STEPS are run per frame; time beyond that is dropped after a hitch.
+SIM_HZ = 120
+MAX_SIM_STEPS = 8
+
+# Maximum number of rendered text surfaces kept by the resource manager (LRU)
+TEXT_CACHE_SIZE = 256
+
+# Opt-in dirty-rectangle presentation: only changed regions are pushed to the display,
+# falling back to a full flip when they cover more than the threshold fraction of the screen
+DIRTY_RECT_RENDERING = False
+DIRTY_RECT_FULL_THRESHOLD = 0.5
+
+# Parallax background scroll in pixels per second, scaled per layer
+BACKGROUND_SCROLL_SPEED = 50
+
+# Maximum number of killed ducks and ground animals kept for reuse by their entity pools
+DUCK_POOL_CAPACITY = 64
+GROUND_ANIMAL_POOL_CAPACITY = 32
+
+# How flying ducks are moved: "sprite" runs Duck.fly per duck, "arrays" advances
+# all of them at once in a NumPy DuckFlightSimulation
+DUCK_FLIGHT_BACKEND = "sprite"
+
+# Degrees between the pre-rotated frames of a falling duck (covers 0-90 degrees)
+FALL_ROTATION_STEP = 5
+
+# Width and height of each shared texture atlas page holding cached sprite frames
+ATLAS_PAGE_SIZE = 1024
+
+# Fixed size of the particle pool, and what happens when an emitter finds it full:
+# "drop_oldest" recycles the oldest live particles, "drop_new" skips the new ones
+PARTICLE_CAPACITY = 16384
+PARTICLE_OVERFLOW_POLICY = "drop_oldest"
+
+# Number of pre-faded frames used while a shot ground animal fades out
+DEATH_FADE_STEPS = 8
+
 # Colors (RGB)
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -68,6 +129,7 @@ GAME_OVER = "game_over"
 # File paths
 ASSETS_PATH = "assets"
 SPRITES_PATH = f"{ASSETS_PATH}/sprites"
+BAKED_SPRITES_PATH = f"{SPRITES_PATH}/baked"
 AUDIO_PATH = f"{ASSETS_PATH}/audio"
 FONTS_PATH = f"{ASSETS_PATH}/fonts"
 DATA_PATH = f"{ASSETS_PATH}/data"
@@ -11,7 +11,7 @@ def clamp(value, min_val, max_val):
     """Clamps a value between a minimum and maximum."""
     return max(min_val, min(value, max_val))
 
-def load_sprite_sheet(sheet, frame_width, frame_height, num_frames):
+def load_sprite_sheet(sheet, frame_width, frame_height, num_frames, copy=True):
     """
     Extracts frames from a sprite sheet.
     
@@ -19,6 +19,7 @@ def load_sprite_sheet(sheet, frame_width, frame_height, num_frames):
     :param frame_width: The width of a single frame.
     :param frame_height: The height of a single frame.
     :param num_frames: The total number of frames to extract.
+    :param copy: If False, frames are zero-copy subsurface views into the sheet.
     :return: A list of surfaces, each being a single frame.
     """
     frames = []
@@ -33,8 +34,11 @@ def load_sprite_sheet(sheet, frame_width, frame_height, num_frames):
             break
             
         rect = pygame.Rect(frame_x, frame_y, frame_width, frame_height)
-        frame = pygame.Surface(rect.size, pygame.SRCALPHA)
-        frame.blit(sheet, (0, 0), rect)
+        if copy:
+            frame = pygame.Surface(rect.size, pygame.SRCALPHA)
+            frame.blit(sheet, (0, 0), rect)
+        else:
+            frame = sheet.subsurface(rect)
         frames.append(frame)
         
     return frames
@@ -9,50 +9,112 @@ and running the main game loop.
 import pygame
 import sys
 import os
-import random
+import time
+import argparse
+import contextlib
+import hashlib
 
 # To run this from the root directory, we need to add the project root to the python path.
 # This is a temporary solution for development. A better solution would be to package the game properly.
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+def parse_args():
+    """
+    Parses the command line. Headless options are handed to the constants
+    module through the environment, so they apply to every module.
+    """
+    parser = argparse.ArgumentParser(description="Duck Hunter")
+    parser.add_argument("--headless", action="store_true",
+                        help="run game sessions without a window or sound, as fast as possible")
+    parser.add_argument("--resolution", help="virtual resolution in headless mode, e.g. 1280x720")
+    parser.add_argument("--render", choices=("none", "offscreen"),
+                        help="headless rendering: skip it (default) or draw every frame off screen")
+    parser.add_argument("--mode", default="normal", choices=("easy", "normal", "hard", "god"),
+                        help="game mode of headless sessions")
+    parser.add_argument("--sessions", type=int, default=1, help="number of headless sessions to play")
+    parser.add_argument("--duration", type=float, default=300.0,
+                        help="game seconds after which a headless session stops")
+    parser.add_argument("--no-autoplay", dest="autoplay", action="store_false",
+                        help="do not let a bot shoot during headless sessions")
+    parser.add_argument("--verbose", action="store_true",
+                        help="keep the game's per-event output in headless mode")
+    parser.add_argument("--seed", type=int, help="seed every game session with this value")
+    parser.add_argument("--record", metavar="PATH", help="save the inputs of each finished session here")
+    parser.add_argument("--replay", metavar="PATH", help="re-simulate a recorded session and verify its end state")
+    args = parser.parse_args()
+    if args.headless:
+        os.environ["DUCK_HUNTER_HEADLESS"] = "1"
+    if args.resolution:
+        os.environ["DUCK_HUNTER_RESOLUTION"] = args.resolution
+    if args.render:
+        os.environ["DUCK_HUNTER_RENDER"] = args.render
+    return args
+
+# The constants module reads the display on import, so parse first
+ARGS = parse_args() if __name__ == '__main__' else None
+
 from game.utils import constants as const
 from game.core.resource_manager import resources
 from game.entities.duck import Duck
 from game.entities.ground_animal import GroundAnimal
-from game.systems.background import ParallaxBackground
+from game.systems.background import get_shared_background
 from game.systems.particles import ParticleSystem
+from game.systems.duck_flight import DuckFlightSimulation
+from game.systems.spatial_hash import SpatialHash
+from game.systems.entity_registry import EntityRegistry
+from game.systems.autoplay import AutoplayBot
 from game.core.audio_manager import audio_manager
 from game.entities.player import Player
 from game.systems.ui import UISystem
 from game.systems.menu_system import MenuSystem
+from game.core.dirty_rects import DirtyRectTracker
+from game.core.frame_scheduler import FrameScheduler
+from game.core.entity_pool import EntityPool
+from game.core.fixed_timestep import FixedTimestep
+from game.core.rng import random_service
+from game.core.replay import InputRecording, SHOT, RELOAD, PAUSE
+from game.utils.math_utils import lerp
 
 class Crosshair(pygame.sprite.Sprite):
     def __init__(self):
         super().__init__()
+        # The crosshair images are shared through the frame cache so they can be baked
+        self.image, self.flash_image, self.hit_indicator = resources.get_frames(
+            ("crosshair", const.UI_SCALE), self.create_crosshair_frames)
+        
+        self.rect = self.image.get_rect()
+        self.hit_radius = int(25 * const.UI_SCALE)  # Larger hit detection radius for easier targeting
+
+    def create_crosshair_frames(self):
+        """Draws the crosshair, its red hit-flash variant and the hit radius indicator."""
         # Scale crosshair size based on display scaling
         crosshair_size = int(60 * const.UI_SCALE)
-        self.image = pygame.Surface((crosshair_size, crosshair_size), pygame.SRCALPHA)
+        image = pygame.Surface((crosshair_size, crosshair_size), pygame.SRCALPHA)
         
         center = crosshair_size // 2
         
         # Draw a more visible crosshair with larger hit area
         # Outer circle (thick) - shows hit radius
         outer_radius = int(25 * const.UI_SCALE)
-        pygame.draw.circle(self.image, (255, 255, 255), (center, center), outer_radius, max(1, int(2 * const.UI_SCALE)))
+        pygame.draw.circle(image, (255, 255, 255), (center, center), outer_radius, max(1, int(2 * const.UI_SCALE)))
         
         # Inner circle (thin)
         inner_radius = int(15 * const.UI_SCALE)
-        pygame.draw.circle(self.image, (255, 255, 255), (center, center), inner_radius, max(1, int(1 * const.UI_SCALE)))
+        pygame.draw.circle(image, (255, 255, 255), (center, center), inner_radius, max(1, int(1 * const.UI_SCALE)))
         
         # Cross lines (longer for better visibility)
         line_width = max(1, int(2 * const.UI_SCALE))
-        pygame.draw.line(self.image, (255, 255, 255), (center, 0), (center, int(12 * const.UI_SCALE)), line_width)
-        pygame.draw.line(self.image, (255, 255, 255), (center, crosshair_size - int(12 * const.UI_SCALE)), (center, crosshair_size), line_width)
-        pygame.draw.line(self.image, (255, 255, 255), (0, center), (int(12 * const.UI_SCALE), center), line_width)
-        pygame.draw.line(self.image, (255, 255, 255), (crosshair_size - int(12 * const.UI_SCALE), center), (crosshair_size, center), line_width)
+        pygame.draw.line(image, (255, 255, 255), (center, 0), (center, int(12 * const.UI_SCALE)), line_width)
+        pygame.draw.line(image, (255, 255, 255), (center, crosshair_size - int(12 * const.UI_SCALE)), (center, crosshair_size), line_width)
+        pygame.draw.line(image, (255, 255, 255), (0, center), (int(12 * const.UI_SCALE), center), line_width)
+        pygame.draw.line(image, (255, 255, 255), (crosshair_size - int(12 * const.UI_SCALE), center), (crosshair_size, center), line_width)
         
         # Center dot
-        pygame.draw.circle(self.image, (255, 255, 255), (center, center), max(1, int(3 * const.UI_SCALE)))
+        pygame.draw.circle(image, (255, 255, 255), (center, center), max(1, int(3 * const.UI_SCALE)))
+        
+        # Flash effect - make it brighter/red for hit feedback
+        flash_image = image.copy()
+        flash_image.fill((255, 100, 100, 255), special_flags=pygame.BLEND_MULT)
         
         # Hit radius indicator (semi-transparent)
         hit_indicator_size = int(50 * const.UI_SCALE)
@@ -61,9 +123,7 @@ class Crosshair(pygame.sprite.Sprite):
         hit_indicator_radius = int(20 * const.UI_SCALE)
         pygame.draw.circle(hit_indicator, (255, 255, 255, 50), (hit_indicator_center, hit_indicator_center), hit_indicator_radius, max(1, int(1 * const.UI_SCALE)))
         
-        self.rect = self.image.get_rect()
-        self.hit_radius = int(25 * const.UI_SCALE)  # Larger hit detection radius for easier targeting
-        self.hit_indicator = hit_indicator
+        return [image, flash_image, hit_indicator]
 
     def update(self, *args):
         self.rect.center = pygame.mouse.get_pos()
@@ -71,11 +131,7 @@ class Crosshair(pygame.sprite.Sprite):
     def draw(self, screen, flash_timer=0, show_hit_radius=False):
         """Draw the crosshair with optional flash effect and hit radius indicator."""
         if flash_timer > 0:
-            # Flash effect - draw a bright version
-            flash_image = self.image.copy()
-            # Make it brighter/red for hit feedback
-            flash_image.fill((255, 100, 100, 255), special_flags=pygame.BLEND_MULT)
-            screen.blit(flash_image, self.rect)
+            screen.blit(self.flash_image, self.rect)
         else:
             screen.blit(self.image, self.rect)
             
@@ -85,9 +141,12 @@ class Crosshair(pygame.sprite.Sprite):
             screen.blit(self.hit_indicator, hit_rect)
 
 class DuckSpawnManager:
-    def __init__(self, sprite_group, player):
-        self.sprite_group = sprite_group
+    def __init__(self, registry, player, flight_simulation=None, pool=None, rng=None):
+        self.registry = registry
+        self.rng = rng or random_service
+        self.pool = pool or EntityPool(Duck, const.DUCK_POOL_CAPACITY)
         self.player = player
+        self.flight_simulation = flight_simulation
         self.spawn_timer = 0
         self.base_spawn_interval = 2.0  # seconds
 
@@ -102,17 +161,20 @@ class DuckSpawnManager:
 
     def spawn_duck(self, score=0):
         # Spawn from the left side at a random height
-        y_pos = random.randint(50, const.SCREEN_HEIGHT - 200)
+        y_pos = self.rng.random.randint(50, const.SCREEN_HEIGHT - 200)
         
         # Choose duck type based on weighted probability
         duck_type = self.choose_duck_type()
-        new_duck = Duck(initial_pos=(-50, y_pos), duck_type=duck_type)
         
         # Increase duck speed based on score
         speed_bonus = (score / 100)
-        new_duck.speed += speed_bonus
+        new_duck = self.pool.acquire(initial_pos=(-50, y_pos), duck_type=duck_type, speed_bonus=speed_bonus,
+                                     rng=self.rng)
+        
+        if self.flight_simulation:
+            self.flight_simulation.add(new_duck)
 
-        self.sprite_group.add(new_duck)
+        self.registry.add(new_duck)
         
     def choose_duck_type(self):
         """Chooses a duck type based on weighted probability."""
@@ -130,11 +192,13 @@ class DuckSpawnManager:
         total_weight = sum(weights)
         weights = [w / total_weight for w in weights]
         
-        return random.choices(duck_types, weights=weights)[0]
+        return self.rng.random.choices(duck_types, weights=weights)[0]
 
 class GroundAnimalSpawnManager:
-    def __init__(self, sprite_group, player):
-        self.sprite_group = sprite_group
+    def __init__(self, registry, player, pool=None, rng=None):
+        self.registry = registry
+        self.rng = rng or random_service
+        self.pool = pool or EntityPool(GroundAnimal, const.GROUND_ANIMAL_POOL_CAPACITY)
         self.player = player
         self.spawn_timer = 0
         self.base_spawn_interval = 2.5  # seconds (more frequent than before)
@@ -151,13 +215,12 @@ class GroundAnimalSpawnManager:
     def spawn_ground_animal(self, score=0):
         # Choose animal type based on weighted probability
         animal_type = self.choose_animal_type(score)
-        new_animal = GroundAnimal(animal_type=animal_type)
         
         # Increase speed based on score
         speed_bonus = (score / 200)
-        new_animal.speed += speed_bonus
+        new_animal = self.pool.acquire(animal_type=animal_type, speed_bonus=speed_bonus, rng=self.rng)
 
-        self.sprite_group.add(new_animal)
+        self.registry.add(new_animal)
         
     def choose_animal_type(self, score):
         """Chooses an animal type based on weighted probability."""
@@ -174,7 +237,7 @@ class GroundAnimalSpawnManager:
         total_weight = sum(weights)
         weights = [w / total_weight for w in weights]
         
-        return random.choices(animal_types, weights=weights)[0]
+        return self.rng.random.choices(animal_types, weights=weights)[0]
 
 class Game:
     """
@@ -187,15 +250,27 @@ class Game:
         pygame.init()
         self.screen = pygame.display.set_mode((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
         pygame.display.set_caption("Duck Hunter")
-        self.clock = pygame.time.Clock()
+        self.frame_scheduler = FrameScheduler(const.FPS, const.IDLE_FPS,
+                                              const.IDLE_GRACE_PERIOD, const.IDLE_WAIT_FOR_EVENTS)
         self.is_running = True
         self.dt = 0
+        # Gameplay advances in fixed steps; rendering interpolates between them
+        self.timestep = FixedTimestep(const.SIM_HZ, const.MAX_SIM_STEPS)
+        self.sim_tick = 0  # Simulation steps run in the current session
+        
+        # All randomness comes from one service, reseeded for every session
+        self.rng = random_service
+        self.session_seed = None  # Seed for new sessions; None picks a fresh one
+        self.recording = None  # Inputs of the current session
+        self.record_path = None  # Where finished recordings are saved, if anywhere
 
         # Initialize managers
         self.resource_manager = resources
+        self.resource_manager.load_baked_sprites()
         
-        # Create sprite groups
-        self.all_sprites = pygame.sprite.Group()
+        # Create sprite groups; entities are also grouped per kind in the registry
+        self.entities = EntityRegistry()
+        self.all_sprites = self.entities.all_sprites
         self.crosshair_group = pygame.sprite.GroupSingle()
         
         # Create initial game objects
@@ -207,20 +282,32 @@ class Game:
         self.selected_mode = "normal"  # Default mode
 
         # Create managers
-        self.duck_spawn_manager = DuckSpawnManager(self.all_sprites, self.player)
-        self.ground_animal_spawn_manager = GroundAnimalSpawnManager(self.all_sprites, self.player)
-        self.background = ParallaxBackground()
-        self.particle_system = ParticleSystem()
+        # Killed entities are recycled across games
+        self.duck_pool = EntityPool(Duck, const.DUCK_POOL_CAPACITY)
+        self.ground_animal_pool = EntityPool(GroundAnimal, const.GROUND_ANIMAL_POOL_CAPACITY)
+        self.create_spawn_managers()
+        self.background = get_shared_background()
+        self.particle_system = ParticleSystem(rng=self.rng)
         self.audio_manager = audio_manager
         self.ui_system = UISystem()
         self.menu_system = MenuSystem(self.screen)
 
         # Game State
         self.paused = False
+        self.pause_snapshot = None  # Frozen game frame with the paused overlay
+        self.pause_title_font = resources.load_font(None, 72)
         self.crosshair_flash_timer = 0
-        self.game_start_time = 0
         self.god_mode_time_limit = 300  # 5 minutes for God Mode
         
+        # Optional dirty-rect presentation (see const.DIRTY_RECT_RENDERING)
+        self.dirty_rect_tracker = None
+        if const.DIRTY_RECT_RENDERING:
+            self.dirty_rect_tracker = DirtyRectTracker(self.screen.get_size(), const.DIRTY_RECT_FULL_THRESHOLD)
+        self.last_background_scroll = None
+        self.last_paused = False
+        self.last_frame_was_menu = True  # Switching between menus and gameplay redraws everything
+        self.last_overlay_rects = []  # What was drawn over the background last gameplay frame
+        
         # Show cursor initially (we're in menu mode)
         pygame.mouse.set_visible(True)
 
@@ -234,7 +321,7 @@ class Game:
             
             # Check if a new game mode was selected
             if hasattr(self.menu_system, 'selected_mode') and self.menu_system.selected_mode:
-                self.start_new_game(self.menu_system.selected_mode)
+                self.start_new_game(self.menu_system.selected_mode, self.session_seed)
                 self.menu_system.selected_mode = None  # Clear the selection
             
             if self.menu_system.is_playing() and not self.paused:
@@ -244,25 +331,71 @@ class Game:
 
             # Cap the frame rate and get delta time.
             # dt is time in seconds since the last frame.
-            self.dt = self.clock.tick(const.FPS) / 1000.0
+            # Menus and the pause screen drop to the idle rate once input stops.
+            idle = self.paused or not self.menu_system.is_playing()
+            self.dt = self.frame_scheduler.tick(idle)
 
         self.quit_game()
 
+    def run_headless(self, mode="normal", duration=300.0, autoplay=True, seed=None):
+        """
+        Plays one game session without waiting for the clock and returns its statistics.
+        Every frame advances the game by 1 / FPS seconds of game time, as fast as
+        the machine allows. Rendering follows const.HEADLESS_RENDER.
+
+        :param mode: The game mode to play.
+        :param duration: Game seconds after which the session stops, unless it is over earlier.
+        :param autoplay: If True, an AutoplayBot shoots at the targets.
+        :param seed: Seed for the session's randomness, or None to pick a fresh one.
+        """
+        self.start_new_game(mode, seed)
+        self.menu_system.current_state = "playing"
+        bot = AutoplayBot(self) if autoplay else None
+        render = const.HEADLESS_RENDER == "offscreen"
+        
+        self.dt = 1.0 / const.FPS
+        frames = 0
+        start_time = time.perf_counter()
+        while self.is_running and self.menu_system.is_playing() and frames * self.dt < duration:
+            self.handle_events()
+            if bot:
+                bot.update(self.dt)
+            self.update()
+            if render:
+                self.render()
+            frames += 1
+        wall_time = time.perf_counter() - start_time
+        
+        game_time = frames * self.dt
+        game_over = not self.menu_system.is_playing()
+        if not game_over:
+            self.finish_recording()
+        return {
+            "mode": mode,
+            "seed": self.rng.seed,
+            "score": self.menu_system.final_score if game_over else self.player.score,
+            "game_over": game_over,
+            "frames": frames,
+            "game_time": game_time,
+            "wall_time": wall_time,
+            "speedup": game_time / wall_time if wall_time > 0 else float('inf'),
+        }
+
     def handle_events(self):
         """
         Processes all events from the Pygame event queue.
         """
         for event in pygame.event.get():
+            self.frame_scheduler.handle_event(event)
             if event.type == pygame.QUIT:
                 self.is_running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_p or event.key == pygame.K_SPACE:
                     if self.menu_system.is_playing():
-                        self.paused = not self.paused
-                        print(f"Game {'PAUSED' if self.paused else 'UNPAUSED'}")
+                        self.set_paused(not self.paused)
                 elif event.key == pygame.K_r:
                     if self.menu_system.is_playing() and not self.paused:
-                        self.player.weapon.start_reload()
+                        self.reload()
                 elif event.key == pygame.K_ESCAPE:
                     if self.menu_system.is_playing():
                         if self.paused:
@@ -272,8 +405,7 @@ class Game:
                             print("Game quit via ESC key")
                         else:
                             # If not paused, ESC pauses the game
-                            self.paused = not self.paused
-                            print(f"Game {'PAUSED' if self.paused else 'UNPAUSED'}")
+                            self.set_paused(True)
             
             # Handle menu events
             if not self.menu_system.is_playing():
@@ -292,53 +424,62 @@ class Game:
                             self.menu_system.set_game_over(self.player.score)
                             self.reset_game()
 
-    def shoot(self):
+    def create_spawn_managers(self):
+        """Creates the spawn managers and the systems tracking what they spawn."""
+        self.duck_flight = self.create_duck_flight()
+        # The registry keeps the grid in sync as targets spawn, change state and die
+        self.target_grid = self.create_target_grid()
+        self.entities.target_grid = self.target_grid
+        self.duck_spawn_manager = DuckSpawnManager(self.entities, self.player, self.duck_flight,
+                                                   self.duck_pool, self.rng)
+        self.ground_animal_spawn_manager = GroundAnimalSpawnManager(self.entities, self.player,
+                                                                    self.ground_animal_pool, self.rng)
+
+    def create_duck_flight(self):
+        """Returns a new flight simulation if ducks use the array backend, else None."""
+        if const.DUCK_FLIGHT_BACKEND == "arrays":
+            return DuckFlightSimulation()
+        return None
+
+    def create_target_grid(self):
+        """Returns an empty spatial hash for the shootable targets."""
+        # Cells twice the hit radius wide: a shot never looks at more than 2x2 cells
+        return SpatialHash(max(1, 2 * self.crosshair.hit_radius))
+
+    def set_paused(self, paused):
+        """Pauses or resumes the game."""
+        self.record_input(PAUSE, int(paused))
+        self.paused = paused
+        self.pause_snapshot = None
+        print(f"Game {'PAUSED' if self.paused else 'UNPAUSED'}")
+
+    def shoot(self, pos=None):
         """
         Handles the shooting logic. Checks for collisions between the crosshair
         and any targets (ducks or ground animals).
+
+        :param pos: Where the shot lands. Defaults to the mouse position.
         """
+        # Get mouse position for hit detection
+        mouse_pos = pygame.mouse.get_pos() if pos is None else pos
+        self.record_input(SHOT, mouse_pos[0], mouse_pos[1])
+        
         if self.player.weapon.shoot():
             self.audio_manager.play_sound("shotgun.wav")
             
-            # Get mouse position for hit detection
-            mouse_pos = pygame.mouse.get_pos()
-            
-            # Check for hits using distance-based detection (more forgiving)
-            hit_targets = []
-            for sprite in self.all_sprites:
-                # Check ducks
-                if hasattr(sprite, 'state') and sprite.state == "flying":
-                    # Calculate distance from mouse to duck center
-                    sprite_center = sprite.rect.center
-                    distance = ((mouse_pos[0] - sprite_center[0])**2 + (mouse_pos[1] - sprite_center[1])**2)**0.5
-                    
-                    # Hit if within hit radius
-                    if distance <= self.crosshair.hit_radius:
-                        hit_targets.append(sprite)
-                
-                # Check ground animals
-                elif hasattr(sprite, 'animal_type') and sprite.state == "walking":
-                    # Calculate distance from mouse to animal center
-                    sprite_center = sprite.rect.center
-                    distance = ((mouse_pos[0] - sprite_center[0])**2 + (mouse_pos[1] - sprite_center[1])**2)**0.5
-                    
-                    # Hit if within hit radius
-                    if distance <= self.crosshair.hit_radius:
-                        hit_targets.append(sprite)
+            # Distance-based detection (more forgiving): the closest target whose
+            # center is within the hit radius, looked up in the spatial hash
+            closest_target = self.target_grid.query_nearest(mouse_pos, self.crosshair.hit_radius)
             
             # Process hits
-            if hit_targets:
-                # Hit the closest target if multiple are in range
-                closest_target = min(hit_targets, key=lambda t: 
-                    ((mouse_pos[0] - t.rect.center[0])**2 + (mouse_pos[1] - t.rect.center[1])**2)**0.5)
-                
+            if closest_target is not None:
                 # Handle different target types
-                if hasattr(closest_target, 'duck_type'):  # It's a duck
+                if closest_target in self.entities.flying_ducks:
                     closest_target.shoot_down()
                     self.particle_system.emit_feathers(closest_target.rect.center)
                     self.audio_manager.play_sound("hit.wav")
                     print(f"Hit! {closest_target.duck_type.title()} duck: +{closest_target.point_value} points")
-                elif hasattr(closest_target, 'animal_type'):  # It's a ground animal
+                else:  # A walking ground animal
                     closest_target.shoot_hit()
                     self.audio_manager.play_sound("hit.wav")
                     print(f"Hit! {closest_target.animal_type.title()}: +{closest_target.point_value} points")
@@ -354,19 +495,25 @@ class Game:
             self.audio_manager.play_sound("empty_click.wav")
             print("Click! Out of ammo.")
 
+    def reload(self):
+        """Starts reloading the player's weapon."""
+        self.record_input(RELOAD)
+        self.player.weapon.start_reload()
+
     def update(self):
         """
         Updates the state of all game objects.
-        The delta time (self.dt) is used to ensure frame-rate independent physics.
+        The frame's delta time (self.dt) is paid out as fixed simulation steps
+        (see simulate), so gameplay does not depend on the frame rate. Purely
+        visual state is advanced once per frame.
         """
         if self.menu_system.is_playing():
+            for _ in range(self.timestep.advance(self.dt)):
+                self.simulate(self.timestep.step_dt)
+            
             self.background.update(self.dt)
-            self.all_sprites.update(self.dt)
             self.crosshair_group.update()
-            self.duck_spawn_manager.update(self.dt, self.player.score)
-            self.ground_animal_spawn_manager.update(self.dt, self.player.score)
             self.particle_system.update(self.dt)
-            self.player.update(self.dt)
             self.ui_system.update(self.dt, "playing")
             
             # Update crosshair flash timer
@@ -375,83 +522,241 @@ class Game:
             
             # Check for God Mode time limit
             if self.player.game_mode == "god":
-                current_time = pygame.time.get_ticks() / 1000.0
-                elapsed_time = current_time - self.game_start_time
-                if elapsed_time >= self.god_mode_time_limit:
+                if self.get_game_time() >= self.god_mode_time_limit:
                     self.menu_system.set_game_over(self.player.score)
                     self.reset_game()
                     print(f"God Mode time limit reached! Final score: {self.player.score}")
         else:
             self.menu_system.update(self.dt)
 
+    def simulate(self, dt):
+        """
+        Advances the gameplay by one fixed simulation step.
+
+        :param dt: The step length in seconds, always timestep.step_dt.
+        """
+        # Remember where everything was, for render interpolation
+        for sprite in self.all_sprites:
+            sprite.prev_center = sprite.rect.center
+        
+        self.entities.advance_animations(dt)
+        self.all_sprites.update(dt)
+        if self.duck_flight:
+            self.duck_flight.step(dt)
+        self.entities.update_target_grid()
+        self.duck_spawn_manager.update(dt, self.player.score)
+        self.ground_animal_spawn_manager.update(dt, self.player.score)
+        self.player.update(dt)
+        self.sim_tick += 1
+
+    def get_game_time(self):
+        """Returns the seconds of gameplay simulated in the current session."""
+        return self.sim_tick * self.timestep.step_dt
+
     def render(self):
         """
         Draws all game objects to the screen.
         """
         if self.menu_system.is_playing():
-            self.screen.fill(const.BLACK)
-            self.background.draw(self.screen)
-            self.all_sprites.draw(self.screen)
-            self.particle_system.draw(self.screen)
-            
-            # Draw crosshair with flash effect
-            self.crosshair.draw(self.screen, self.crosshair_flash_timer)
-            
-            # Calculate elapsed time for timer display
-            current_time = pygame.time.get_ticks() / 1000.0
-            elapsed_time = current_time - self.game_start_time
-            time_limit = self.god_mode_time_limit if self.player.game_mode == "god" else 0
-            
-            self.ui_system.draw(self.screen, self.player, elapsed_time, time_limit)
-            
-            if self.paused:
-                self.draw_paused()
+            if self.paused and self.pause_snapshot is not None:
+                # Nothing changes while paused: re-present the frozen frame
+                self.screen.blit(self.pause_snapshot, (0, 0))
+            else:
+                if self.dirty_rect_tracker and not self.needs_full_redraw():
+                    # Everything else on screen still shows the background as it was
+                    self.background.restore(self.screen, self.get_background_dirty_rects() + self.last_overlay_rects)
+                else:
+                    self.screen.fill(const.BLACK)
+                    self.background.draw(self.screen)
+                entity_rects = self.draw_entities(self.timestep.alpha)
+                self.particle_system.draw(self.screen)
+                
+                # Draw crosshair with flash effect
+                self.crosshair.draw(self.screen, self.crosshair_flash_timer)
+                
+                # Calculate elapsed time for timer display
+                elapsed_time = self.get_game_time()
+                time_limit = self.god_mode_time_limit if self.player.game_mode == "god" else 0
+                
+                hud_rects = self.ui_system.draw(self.screen, self.player, elapsed_time, time_limit)
+                
+                if self.paused:
+                    # Composite the overlay once, when the pause starts
+                    self.draw_paused()
+                    self.pause_snapshot = self.screen.copy()
+                
+                if self.dirty_rect_tracker:
+                    self.mark_dirty_regions(entity_rects, hud_rects)
+            self.last_frame_was_menu = False
         else:
             # Draw menu
-            self.menu_system.draw(self.player.score)
+            menu_rect = self.menu_system.draw(self.player.score)
+            if self.dirty_rect_tracker:
+                if self.last_frame_was_menu:
+                    self.dirty_rect_tracker.mark_many(self.get_background_dirty_rects())
+                    if menu_rect:
+                        self.dirty_rect_tracker.mark(menu_rect)
+                else:
+                    self.dirty_rect_tracker.mark_all()
+                self.last_background_scroll = self.background.scroll
+            self.last_frame_was_menu = True
+
+        if self.dirty_rect_tracker:
+            self.dirty_rect_tracker.present()  # Update only what changed
+        else:
+            pygame.display.flip()  # Update the full display
 
-        pygame.display.flip()  # Update the full display
+    def draw_entities(self, alpha):
+        """
+        Draws every entity between its position before and after the last
+        simulation step and returns the rects drawn.
+
+        :param alpha: How far to go from the previous towards the latest position, from 0 to 1.
+        """
+        images = []
+        rects = []
+        for sprite in self.all_sprites:
+            (prev_x, prev_y), (x, y) = sprite.prev_center, sprite.rect.center
+            images.append(sprite.image)
+            rects.append(sprite.image.get_rect(center=(lerp(prev_x, x, alpha), lerp(prev_y, y, alpha))))
+        self.screen.fblits(zip(images, rects))
+        return rects
+
+    def mark_dirty_regions(self, entity_rects, hud_rects):
+        """Tells the dirty-rect tracker which parts of the gameplay frame changed."""
+        tracker = self.dirty_rect_tracker
+        
+        if self.needs_full_redraw():
+            tracker.mark_all()
+        tracker.mark_many(self.get_background_dirty_rects())
+        self.last_background_scroll = self.background.scroll
+        self.last_paused = self.paused
+        
+        overlay_rects = entity_rects + [self.crosshair.rect.copy()] + hud_rects
+        particles_rect = self.particle_system.bounding_rect()
+        if particles_rect:
+            overlay_rects.append(particles_rect)
+        tracker.mark_many(overlay_rects)
+        self.last_overlay_rects = overlay_rects
+
+    def needs_full_redraw(self):
+        """Returns True if coming from a menu or a pause toggle changed the whole screen."""
+        return self.last_frame_was_menu or self.paused != self.last_paused
+
+    def get_background_dirty_rects(self):
+        """Returns the background bands that scrolled since the last frame."""
+        return self.background.get_changed_rects(self.last_background_scroll)
+
+    def start_new_game(self, mode="normal", seed=None):
+        """
+        Starts a new game with the specified mode.
 
-    def start_new_game(self, mode="normal"):
-        """Starts a new game with the specified mode."""
+        :param seed: Seed for the session's randomness, or None to pick a fresh one.
+        """
         # Clear all sprites
-        self.all_sprites.empty()
+        self.entities.empty()
+        
+        # Everything below draws from the reseeded service
+        seed = self.rng.reseed(seed)
+        self.recording = InputRecording(seed, mode, const.SIM_HZ, (const.SCREEN_WIDTH, const.SCREEN_HEIGHT),
+                                        self.background.seed)
         
         # Create new player with selected mode
         self.player = Player(mode)
         self.selected_mode = mode
         
         # Reset managers
-        self.duck_spawn_manager = DuckSpawnManager(self.all_sprites, self.player)
-        self.ground_animal_spawn_manager = GroundAnimalSpawnManager(self.all_sprites, self.player)
-        self.particle_system = ParticleSystem()
+        self.create_spawn_managers()
+        self.particle_system = ParticleSystem(rng=self.rng)
+        self.pause_snapshot = None
+        self.timestep.reset()
+        self.sim_tick = 0
         
-        # Start game timer
-        self.game_start_time = pygame.time.get_ticks() / 1000.0
-        
-        print(f"Starting new game in {mode.upper()} mode!")
+        print(f"Starting new game in {mode.upper()} mode! (seed {seed})")
 
     def reset_game(self):
         """Resets the game state for a new game."""
+        self.finish_recording()
+        
         # Clear all sprites
-        self.all_sprites.empty()
+        self.entities.empty()
         
         # Reset player (keep current game mode)
         current_mode = self.player.game_mode
         self.player = Player(current_mode)
         
         # Reset managers
-        self.duck_spawn_manager = DuckSpawnManager(self.all_sprites, self.player)
-        self.ground_animal_spawn_manager = GroundAnimalSpawnManager(self.all_sprites, self.player)
-        self.particle_system = ParticleSystem()
+        self.create_spawn_managers()
+        self.particle_system = ParticleSystem(rng=self.rng)
+        self.pause_snapshot = None
+        self.timestep.reset()
+        self.sim_tick = 0
+
+    def record_input(self, kind, *values):
+        """Adds a player input to the current session's recording."""
+        if self.recording is not None:
+            self.recording.record(self.sim_tick, kind, *values)
+
+    def finish_recording(self):
+        """Ends the current session's recording and saves it if record_path is set."""
+        if self.recording is None or self.recording.end_tick is not None:
+            return
+        self.recording.finish(self.sim_tick, self.state_checksum())
+        if self.record_path:
+            self.recording.save(self.record_path)
+            print(f"Replay saved to {self.record_path}")
+
+    def state_checksum(self):
+        """Returns a digest of the simulation state, to compare a replay with its recording."""
+        state = [self.sim_tick, self.player.score, self.player.weapon.current_ammo]
+        for sprite in self.all_sprites:
+            state.append((type(sprite).__name__, sprite.state, tuple(sprite.rect), tuple(sprite.pos), sprite.speed))
+        return hashlib.sha256(repr(state).encode()).hexdigest()[:16]
+
+    def replay(self, recording):
+        """
+        Re-simulates a recorded session step by step, applying each input at its
+        tick, and returns True if it ends in the recorded state.
+
+        :param recording: An InputRecording of a finished session.
+        """
+        if recording.sim_hz != const.SIM_HZ:
+            raise ValueError(f"Recorded at {recording.sim_hz} Hz, but the simulation runs at {const.SIM_HZ} Hz")
+        if tuple(recording.screen_size) != (const.SCREEN_WIDTH, const.SCREEN_HEIGHT):
+            raise ValueError(f"Recorded at {recording.screen_size[0]}x{recording.screen_size[1]}; "
+                             f"run with that resolution to replay it")
+        self.start_new_game(recording.mode, recording.seed)
+        self.recording = None
+        self.menu_system.current_state = "playing"
+        
+        events = recording.events
+        next_event = 0
+        for tick in range(recording.end_tick + 1):
+            while next_event < len(events) and events[next_event][0] == tick:
+                self.apply_input(events[next_event])
+                next_event += 1
+            if tick < recording.end_tick:
+                self.simulate(self.timestep.step_dt)
+                # Escapes only cost lives, which end the session; the recording already knows when
+                pygame.event.clear(pygame.USEREVENT)
+        return self.state_checksum() == recording.checksum
+
+    def apply_input(self, event):
+        """Performs a recorded input."""
+        kind = event[1]
+        if kind == SHOT:
+            self.shoot((event[2], event[3]))
+        elif kind == RELOAD:
+            self.reload()
+        elif kind == PAUSE:
+            self.set_paused(bool(event[2]))
 
     def draw_paused(self):
         """Draws the paused screen."""
         font = self.ui_system.font
-        title_font = pygame.font.Font(None, 72)
         
         # Main paused text
-        paused_text = title_font.render("PAUSED", True, const.WHITE)
+        paused_text = resources.render_text(self.pause_title_font, "PAUSED", const.WHITE)
         paused_rect = paused_text.get_rect(center=(const.SCREEN_WIDTH / 2, const.SCREEN_HEIGHT / 2 - 50))
         
         # Instructions
@@ -476,7 +781,7 @@ class Game:
         
         # Draw instructions
         for i, instruction in enumerate(instructions):
-            text_surface = font.render(instruction, True, const.WHITE)
+            text_surface = resources.render_text(font, instruction, const.WHITE)
             text_rect = text_surface.get_rect(center=(const.SCREEN_WIDTH / 2, const.SCREEN_HEIGHT / 2 + 20 + i * 30))
             self.screen.blit(text_surface, text_rect)
 
@@ -484,6 +789,8 @@ class Game:
         """
         Cleans up and exits the game.
         """
+        if self.menu_system.is_playing():
+            self.finish_recording()
         pygame.quit()
         sys.exit()
 
@@ -492,5 +799,27 @@ if __name__ == '__main__':
     # This ensures that relative paths for assets work correctly.
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
     os.chdir('..')
+    recording = InputRecording.load(ARGS.replay) if ARGS.replay else None
+    # The shared background is laid out while the Game is built, from the seed at that time
+    background_seed = recording.background_seed if recording else ARGS.seed
+    if background_seed is not None:
+        random_service.reseed(background_seed)
     game = Game()
-    game.run() 
\ No newline at end of file
+    game.session_seed = ARGS.seed
+    game.record_path = ARGS.record
+    if recording:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(sys.stdout if ARGS.verbose else devnull):
+            matched = game.replay(recording)
+        print(f"Replayed {recording.end_tick} ticks of seed {recording.seed}: score {game.player.score}, "
+              f"{'state matches the recording' if matched else 'STATE DIFFERS FROM THE RECORDING'}")
+        game.quit_game()
+    if const.HEADLESS:
+        for session in range(ARGS.sessions):
+            # Per-shot messages would dominate the run time of a fast session
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(sys.stdout if ARGS.verbose else devnull):
+                stats = game.run_headless(ARGS.mode, ARGS.duration, ARGS.autoplay, ARGS.seed)
+            print(f"Session {session + 1}/{ARGS.sessions} (seed {stats['seed']}): score {stats['score']}, "
+                  f"{stats['game_time']:.1f} s of game time in {stats['wall_time']:.2f} s "
+                  f"(x{stats['speedup']:.1f}){', game over' if stats['game_over'] else ''}")
+        game.quit_game()
+    game.run()
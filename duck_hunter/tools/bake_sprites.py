@@ -0,0 +1,108 @@
+"""
+bake_sprites.py
+
+Renders every procedural sprite (ducks, ground animals, clouds and the
+crosshair) into packed PNG atlases plus a JSON manifest, one directory per
+UI scale under assets/sprites/baked. At startup ResourceManager loads the
+bake matching the display scale instead of drawing the sprites again.
+
+    python duck_hunter/tools/bake_sprites.py                  # scale of DUCK_HUNTER_RESOLUTION
+    python duck_hunter/tools/bake_sprites.py --scale 1 --scale 2
+
+The atlases are plain PNG + JSON so the mobile ports can consume them as well.
+"""
+import os
+import sys
+import io
+import json
+import argparse
+import contextlib
+
+# No window or sound is needed, so the tool runs headless on SDL's dummy drivers
+# (see HEADLESS in constants.py), also on servers and in CI without a display.
+# The default scale then follows DUCK_HUNTER_RESOLUTION.
+os.environ.setdefault("DUCK_HUNTER_HEADLESS", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from game.utils import constants as const
+from game.core.resource_manager import resources
+from game.core.texture_atlas import TextureAtlas
+from game.entities.duck import Duck, DUCK_TYPES
+from game.entities.ground_animal import GroundAnimal, ANIMAL_TYPES
+from game.systems.background import cloud_sizes, get_cloud_surface
+from main import Crosshair
+
+def render_all_sprites():
+    """Builds every procedural sprite into the frame cache at the current UI_SCALE."""
+    # Entity constructors log which asset path they took; keep the output readable.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for duck_type in DUCK_TYPES:
+            Duck(initial_pos=(0, 0), duck_type=duck_type)
+        for animal_type in ANIMAL_TYPES:
+            GroundAnimal(animal_type=animal_type)
+        for size in cloud_sizes():
+            get_cloud_surface(size)
+        Crosshair()
+
+def bake(ui_scale, page_size):
+    """Renders all sprites at a UI scale and writes the atlas pages and manifest."""
+    const.UI_SCALE = ui_scale
+    resources.clear_frame_cache()
+    Duck.animation_clips.clear()
+    GroundAnimal.walk_clips.clear()
+    render_all_sprites()
+
+    # Pack the tallest frames first so the shelves stay tight
+    frames = [(key, i, frame) for key, key_frames in resources.frame_cache.items()
+              for i, frame in enumerate(key_frames)]
+    frames.sort(key=lambda entry: entry[2].get_height(), reverse=True)
+
+    atlas = TextureAtlas(page_size)
+    locations = {}
+    for key, i, frame in frames:
+        page_index, rect = atlas.add(frame)
+        locations[(key, i)] = [page_index, rect.x, rect.y, rect.width, rect.height]
+
+    bake_dir = resources.baked_sprites_dir(ui_scale)
+    os.makedirs(bake_dir, exist_ok=True)
+    page_names = []
+    for i, page in enumerate(atlas.trimmed_pages()):
+        page_name = f"atlas_{i}.png"
+        pygame.image.save(page, os.path.join(bake_dir, page_name))
+        page_names.append(page_name)
+
+    manifest = {
+        "ui_scale": ui_scale,
+        "pages": page_names,
+        "sprites": [
+            {"key": list(key), "frames": [locations[(key, i)] for i in range(len(key_frames))]}
+            for key, key_frames in resources.frame_cache.items()
+        ]
+    }
+    with open(os.path.join(bake_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"Baked {len(manifest['sprites'])} sprites ({len(frames)} frames) "
+          f"into {len(page_names)} page(s) at {bake_dir}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake procedural sprites into PNG atlases")
+    parser.add_argument("--scale", type=float, action="append", dest="scales",
+                        help="UI scale to bake for, may be repeated "
+                             "(default: the scale of DUCK_HUNTER_RESOLUTION, 1920x1080 unless set)")
+    parser.add_argument("--page-size", type=int, default=2048)
+    args = parser.parse_args()
+
+    # Asset paths are relative to the project root, like when running main.py
+    os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+    pygame.init()
+    for ui_scale in args.scales or [const.UI_SCALE]:
+        bake(ui_scale, args.page_size)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,379 @@
+"""
+benchmark.py
+
+Microbenchmarks for the hot paths of the game. Run from the repository root:
+
+    python duck_hunter/tools/benchmark.py spawn
+
+Each benchmark prints the cost of the old path ("before") next to the
+current one ("after") so the effect of an optimization can be checked on any machine.
+"""
+import os
+import sys
+import io
+import time
+import random
+import argparse
+import contextlib
+import tracemalloc
+from copy import copy
+
+# Benchmarks never need a real window or sound card.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from game.utils import constants as const
+from game.core.resource_manager import resources
+from game.entities.duck import Duck, DUCK_TYPES
+from game.entities.ground_animal import GroundAnimal, ANIMAL_TYPES
+from game.systems.background import ParallaxBackground, draw_cloud
+from game.systems.particles import ParticleSystem
+from game.systems.duck_flight import DuckFlightSimulation
+from game.systems.spatial_hash import SpatialHash
+from game.core.entity_pool import EntityPool
+from game.core.animation import AnimationState
+
+def time_per_call(func, iterations, setup=None):
+    """
+    Returns the average wall time of func() in microseconds.
+
+    :param setup: Optional callable run before every call, outside the timing.
+    """
+    total = 0.0
+    for _ in range(iterations):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        total += time.perf_counter() - start
+    return total / iterations * 1e6
+
+def clear_sprite_caches():
+    """
+    Forgets all shared frames, reproducing the cost of an uncached spawn. An
+    empty atlas page is opened here so its allocation is not timed as frame loading.
+    """
+    resources.clear_frame_cache()
+    resources.atlas.new_page()
+    Duck.animation_clips.clear()
+    GroundAnimal.walk_clips.clear()
+
+def report(name, before_us, after_us):
+    """Prints the cost of the old path next to the current one."""
+    speedup = before_us / after_us if after_us > 0 else float('inf')
+    print(f"{name:<24} before {before_us:9.1f} us   after {after_us:9.1f} us   x{speedup:.1f}")
+
+def bench_spawn(iterations):
+    """Measures the cost of constructing one duck or ground animal."""
+    print(f"Spawn cost per entity (UI_SCALE={const.UI_SCALE:.3f}, {iterations} spawns)")
+    # Entity constructors log which asset path they took; keep the output readable.
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = []
+        for duck_type in DUCK_TYPES:
+            spawn = lambda: Duck(initial_pos=(-50, 100), duck_type=duck_type)
+            uncached = time_per_call(spawn, iterations, setup=clear_sprite_caches)
+            spawn()
+            cached = time_per_call(spawn, iterations)
+            results.append((f"duck/{duck_type}", uncached, cached))
+        for animal_type in ANIMAL_TYPES:
+            spawn = lambda: GroundAnimal(animal_type=animal_type)
+            uncached = time_per_call(spawn, iterations, setup=clear_sprite_caches)
+            spawn()
+            cached = time_per_call(spawn, iterations)
+            results.append((f"ground_animal/{animal_type}", uncached, cached))
+    for result in results:
+        report(*result)
+
+def create_legacy_layer(width, height, color, ground_height):
+    """A full-height transparent layer like the background used before banded strips."""
+    layer = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(layer, color, (0, height - ground_height, width, ground_height))
+    return layer
+
+def legacy_background_draw(background, legacy_layers, surface):
+    """
+    The background draw before the cloud strip and banded layers: one new cloud
+    surface per cloud per frame and two full-height layers.
+    """
+    surface.fill((135, 206, 235))
+    for cloud in background.clouds:
+        x_pos = cloud.x - ((background.scroll * background.cloud_speed) % (const.SCREEN_WIDTH * 2))
+        if x_pos < -cloud.width:
+            x_pos += const.SCREEN_WIDTH * 2
+        surface.blit(draw_cloud(cloud.size), (x_pos, cloud.y))
+    for layer, speed in legacy_layers:
+        x_pos = -((background.scroll * speed) % layer.get_width())
+        surface.blit(layer, (x_pos, 0))
+        surface.blit(layer, (x_pos + layer.get_width(), 0))
+
+def bench_background(iterations):
+    """Measures the per-frame cost of drawing the parallax background."""
+    print(f"Background draw per frame ({const.SCREEN_WIDTH}x{const.SCREEN_HEIGHT}, {iterations} frames)")
+    screen = pygame.display.set_mode((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
+    background = ParallaxBackground()
+    legacy_layers = [
+        (create_legacy_layer(const.SCREEN_WIDTH * 2, const.SCREEN_HEIGHT, (34, 139, 34), 100), 0.25),
+        (create_legacy_layer(const.SCREEN_WIDTH * 2, const.SCREEN_HEIGHT, (0, 100, 0), 200), 0.5)
+    ]
+
+    def scroll():
+        background.update(1 / const.FPS)
+
+    legacy = time_per_call(lambda: legacy_background_draw(background, legacy_layers, screen), iterations, setup=scroll)
+    current = time_per_call(lambda: background.draw(screen), iterations, setup=scroll)
+    report("background", legacy, current)
+
+    legacy_bytes = sum(layer.get_width() * layer.get_height() * layer.get_bytesize() for layer, _ in legacy_layers)
+    print(f"{'background memory':<24} before {legacy_bytes / 1024:9.0f} KB   after {background.memory_footprint() / 1024:9.0f} KB"
+          f"   (per instance; menus and gameplay now share one)")
+
+class LegacyParticle(pygame.sprite.Sprite):
+    """A feather as drawn before the array-backed ParticleSystem: one sprite and surface each."""
+    def __init__(self, pos, color, size, velocity, lifetime):
+        super().__init__()
+        self.image = pygame.Surface((size, size))
+        pygame.draw.circle(self.image, color, (size // 2, size // 2), size // 2)
+        self.rect = self.image.get_rect(center=pos)
+        self.pos = pygame.math.Vector2(pos)
+        self.velocity = pygame.math.Vector2(velocity)
+        self.lifetime = lifetime
+        self.age = 0
+
+    def update(self, dt):
+        self.pos += self.velocity * dt
+        self.rect.center = self.pos
+        self.age += dt
+        if self.age >= self.lifetime:
+            self.kill()
+
+def legacy_emit_feathers(group, pos):
+    """The sprite-based feather burst, with the same parameters as ParticleSystem.emit_feathers."""
+    min_size = max(1, int(2 * const.UI_SCALE))
+    max_size = max(1, int(5 * const.UI_SCALE))
+    for _ in range(20):
+        vel = (random.uniform(-150, 150), random.uniform(-200, 0))
+        group.add(LegacyParticle(pos, (255, 255, 255), random.randint(min_size, max_size),
+                                 vel, random.uniform(0.5, 1.5)))
+
+def bench_particles(iterations, live_particles=10000):
+    """Measures one update and draw of a large feather population, topped up every frame."""
+    print(f"Particle update + draw per frame ({live_particles} live particles, {iterations} frames)")
+    screen = pygame.display.set_mode((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
+    center = (const.SCREEN_WIDTH / 2, const.SCREEN_HEIGHT / 2)
+    dt = 1 / const.FPS
+
+    legacy_group = pygame.sprite.Group()
+    def legacy_top_up():
+        while len(legacy_group) < live_particles:
+            legacy_emit_feathers(legacy_group, center)
+    def legacy_frame():
+        legacy_group.update(dt)
+        legacy_group.draw(screen)
+
+    particle_system = ParticleSystem()
+    def top_up():
+        while particle_system.count < live_particles:
+            particle_system.emit_feathers(center)
+    def frame():
+        particle_system.update(dt)
+        particle_system.draw(screen)
+
+    legacy = time_per_call(legacy_frame, iterations, setup=legacy_top_up)
+    current = time_per_call(frame, iterations, setup=top_up)
+    report("particles", legacy, current)
+    print(f"{'frame budget used':<24} before {legacy / 1e4 * const.FPS:8.1f} %    after {current / 1e4 * const.FPS:8.1f} %")
+
+    # Steady state: the pool must not allocate, whatever the emission rate
+    stats_before = particle_system.get_stats()
+    time_per_call(frame, iterations, setup=top_up)
+    stats = particle_system.get_stats()
+    print(f"{'pool':<24} capacity {stats['capacity']}, high water {stats['high_water']}, "
+          f"evicted {stats['evicted']}, dropped {stats['dropped']}, "
+          f"new allocations {stats['allocations'] - stats_before['allocations']}, "
+          f"gc collections {stats['gc_collections'] - stats_before['gc_collections']}")
+
+def bench_flight(iterations, num_ducks=2000):
+    """Measures one flight step of a dense duck wave, per duck and with the array backend."""
+    print(f"Duck flight step per frame ({num_ducks} flying ducks, {iterations} frames)")
+    pygame.display.set_mode((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
+    dt = 1 / const.FPS
+
+    def spawn_wave(flight_simulation=None):
+        # Half the wave is on screen, half still approaching; none escapes during the run
+        with contextlib.redirect_stdout(io.StringIO()):
+            ducks = [Duck(initial_pos=(random.uniform(-const.SCREEN_WIDTH, const.SCREEN_WIDTH - 100), random.uniform(50, const.SCREEN_HEIGHT - 200)))
+                     for _ in range(num_ducks)]
+        for duck in ducks:
+            duck.speed = 1
+            if flight_simulation:
+                flight_simulation.add(duck)
+        return ducks
+
+    ducks = spawn_wave()
+    def legacy_step():
+        for duck in ducks:
+            duck.fly(dt)
+
+    flight_simulation = DuckFlightSimulation()
+    spawn_wave(flight_simulation)
+
+    legacy = time_per_call(legacy_step, iterations)
+    current = time_per_call(lambda: flight_simulation.step(dt), iterations)
+    report("flight", legacy, current)
+
+def legacy_find_target(sprites, mouse_pos, hit_radius):
+    """The shot hit-test before the spatial hash: a scan over every sprite, then a second pass."""
+    hit_targets = []
+    for sprite in sprites:
+        if hasattr(sprite, 'state') and sprite.state == "flying":
+            sprite_center = sprite.rect.center
+            distance = ((mouse_pos[0] - sprite_center[0])**2 + (mouse_pos[1] - sprite_center[1])**2)**0.5
+            if distance <= hit_radius:
+                hit_targets.append(sprite)
+        elif hasattr(sprite, 'animal_type') and sprite.state == "walking":
+            sprite_center = sprite.rect.center
+            distance = ((mouse_pos[0] - sprite_center[0])**2 + (mouse_pos[1] - sprite_center[1])**2)**0.5
+            if distance <= hit_radius:
+                hit_targets.append(sprite)
+    if not hit_targets:
+        return None
+    return min(hit_targets, key=lambda t:
+        ((mouse_pos[0] - t.rect.center[0])**2 + (mouse_pos[1] - t.rect.center[1])**2)**0.5)
+
+def bench_shot(iterations):
+    """Measures the hit-test of one shot as the number of live targets grows."""
+    print(f"Shot hit-test ({iterations} shots per size)")
+    hit_radius = int(25 * const.UI_SCALE)
+    with contextlib.redirect_stdout(io.StringIO()):
+        targets = [Duck(initial_pos=(random.uniform(0, const.SCREEN_WIDTH), random.uniform(0, const.SCREEN_HEIGHT)))
+                   for _ in range(5000)]
+    shots = [(random.randint(0, const.SCREEN_WIDTH), random.randint(0, const.SCREEN_HEIGHT))
+             for _ in range(iterations)]
+
+    for num_targets in (100, 1000, 5000):
+        sprites = pygame.sprite.Group(targets[:num_targets])
+        grid = SpatialHash(2 * hit_radius)
+        for target in sprites:
+            grid.insert(target)
+
+        shot_iter = iter(shots * 2)
+        legacy = time_per_call(lambda: legacy_find_target(sprites, next(shot_iter), hit_radius), iterations)
+        shot_iter = iter(shots * 2)
+        current = time_per_call(lambda: grid.query_nearest(next(shot_iter), hit_radius), iterations)
+        report(f"shot/{num_targets} targets", legacy, current)
+
+def bench_pool(iterations):
+    """Measures a spawn and despawn with and without an entity pool, shared frames cached."""
+    print(f"Spawn + kill per entity ({iterations} cycles)")
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = []
+        pools = []
+        for factory, types, key in ((Duck, list(DUCK_TYPES), "duck_type"),
+                                    (GroundAnimal, list(ANIMAL_TYPES), "animal_type")):
+            pool = EntityPool(factory, 8)
+            type_iter = iter(types * (2 * iterations + 2))
+            construct = lambda: factory(initial_pos=(-50, 100), **{key: next(type_iter)}).kill()
+            recycle = lambda: pool.acquire(initial_pos=(-50, 100), **{key: next(type_iter)}).kill()
+            construct()
+            recycle()
+            results.append((f"pool/{factory.__name__}", time_per_call(construct, iterations),
+                            time_per_call(recycle, iterations)))
+            pools.append((factory.__name__, pool))
+    for result in results:
+        report(*result)
+    for name, pool in pools:
+        print(f"pool/{name} stats: {pool.get_stats()}")
+
+class LegacyEntity(pygame.sprite.Sprite):
+    """
+    An entity holding its attributes in an instance __dict__, like the entities before
+    __slots__. It is a synthetic copy of the current entities' values, not the old classes.
+    """
+
+def legacy_entity_copy(entity):
+    """Returns a LegacyEntity with its own copy of every per-entity value, type data as a dict."""
+    legacy = LegacyEntity()
+    slots = [name for cls in type(entity).__mro__ for name in getattr(cls, "__slots__", ())]
+    for name in slots:
+        value = getattr(entity, name)
+        if name == "type_data":
+            value = dict(value._asdict())
+        elif name == "animation":
+            value = AnimationState(value.clip)
+        elif isinstance(value, (list, pygame.Rect, pygame.math.Vector2)):
+            value = copy(value)
+        setattr(legacy, name, value)
+    return legacy
+
+def allocated_bytes(func):
+    """Returns the bytes still allocated after func() and the value it returned."""
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    result = func()
+    allocated = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return allocated, result
+
+def bench_memory(iterations, num_entities=1000):
+    """
+    Measures the memory held per entity and attribute reads in an update-like loop.
+    'before' is a LegacyEntity copy of the same values. Sprite has no __slots__, so
+    the entities still carry a __dict__ of Sprite's own; it is reported separately.
+    """
+    print(f"Entity memory and attribute access ({num_entities} entities, {iterations} passes)")
+    print("before: the same values copied into a LegacyEntity __dict__, not the pre-__slots__ classes")
+
+    def touch(entities):
+        for entity in entities:
+            entity.pos.x += entity.speed
+            entity.rect.center = entity.pos
+            entity.image
+            entity.state
+
+    for name, spawn in (("duck", lambda: Duck((-50, 100), random.choice(list(DUCK_TYPES)))),
+                        ("ground_animal", lambda: GroundAnimal(random.choice(list(ANIMAL_TYPES))))):
+        with contextlib.redirect_stdout(io.StringIO()):
+            spawn()
+            current_bytes, entities = allocated_bytes(lambda: [spawn() for _ in range(num_entities)])
+        legacy_bytes, legacy_entities = allocated_bytes(lambda: [legacy_entity_copy(e) for e in entities])
+        print(f"{name + ' bytes':<24} before {legacy_bytes / num_entities:9.0f} B    "
+              f"after {current_bytes / num_entities:9.0f} B")
+        # Included in 'after': Sprite.__init__ fills a __dict__ the slots cannot remove
+        dict_bytes = sum(sys.getsizeof(e.__dict__) + sys.getsizeof(e.__dict__["_Sprite__g"])
+                         for e in entities) / num_entities
+        print(f"{name + ' __dict__':<24} {dict_bytes:9.0f} B per entity still held by Sprite "
+              f"({', '.join(entities[0].__dict__)})")
+        report(f"{name} access", time_per_call(lambda: touch(legacy_entities), iterations) / num_entities,
+               time_per_call(lambda: touch(entities), iterations) / num_entities)
+
+BENCHMARKS = {
+    "spawn": bench_spawn,
+    "background": bench_background,
+    "particles": bench_particles,
+    "flight": bench_flight,
+    "shot": bench_shot,
+    "pool": bench_pool,
+    "memory": bench_memory,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Duck Hunter microbenchmarks")
+    parser.add_argument("benchmarks", nargs="*", metavar="name",
+                        help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("-n", "--iterations", type=int, default=200)
+    args = parser.parse_args()
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(unknown)}")
+
+    pygame.init()
+    for name in args.benchmarks or BENCHMARKS:
+        BENCHMARKS[name](args.iterations)
+        print()
+
+if __name__ == '__main__':
+    main()